@@ -5,19 +5,48 @@ from .main import (
     tile_to_cell,
     cell_to_point,
     point_to_cell,
+    points_to_cells,
+    mercator_to_cell,
+    mercator_to_cells,
+    points_to_cell_counts,
     cell_to_boundary,
     cell_to_bounding_box,
     get_resolution,
     index_to_string,
     string_to_index,
+    indexes_to_strings,
+    strings_to_indexes,
+    indexes_to_int64,
+    int64_to_indexes,
     k_ring,
     k_ring_distances,
+    k_ring_aggregate,
     cell_sibling,
+    cell_siblings,
+    grid_path_cells,
+    grid_paths_cells,
     cell_to_parent,
     cell_to_children,
+    cell_to_children_range,
+    tile_to_cell_range,
+    tiles_to_cell_ranges,
     geometry_to_cells,
+    point_radius_to_cells,
     cell_area,
+    cell_areas,
+    cells_area,
+    geometry_area_covered,
 )
+from .cellset import CellSet
+from .dissolve import cells_to_geometry
+from .geojson import write_geojson
+from .graph import cells_adjacency
+from .index import ContainmentIndex, CoverIndex
+from .lookup import LookupTable, write_lookup_table
+from .partition import partition_cells
+from .pyramid import PyramidAccumulator, build_pyramid
+from .raster import cells_to_raster, raster_to_cells
+from .serialization import CellSetReader, dump_cells, load_cells
 from ._version import __version__
 
 __all__ = [
@@ -27,17 +56,52 @@ __all__ = [
     "tile_to_cell",
     "cell_to_point",
     "point_to_cell",
+    "points_to_cells",
+    "mercator_to_cell",
+    "mercator_to_cells",
+    "points_to_cell_counts",
     "cell_to_boundary",
     "cell_to_bounding_box",
     "get_resolution",
     "index_to_string",
     "string_to_index",
+    "indexes_to_strings",
+    "strings_to_indexes",
+    "indexes_to_int64",
+    "int64_to_indexes",
     "k_ring",
     "k_ring_distances",
+    "k_ring_aggregate",
     "cell_sibling",
+    "cell_siblings",
+    "grid_path_cells",
+    "grid_paths_cells",
     "cell_to_parent",
     "cell_to_children",
+    "cell_to_children_range",
+    "tile_to_cell_range",
+    "tiles_to_cell_ranges",
     "geometry_to_cells",
+    "point_radius_to_cells",
     "cell_area",
+    "cell_areas",
+    "cells_area",
+    "geometry_area_covered",
+    "write_geojson",
+    "cells_to_geometry",
+    "cells_adjacency",
+    "CellSet",
+    "ContainmentIndex",
+    "CoverIndex",
+    "build_pyramid",
+    "partition_cells",
+    "PyramidAccumulator",
+    "dump_cells",
+    "load_cells",
+    "CellSetReader",
+    "LookupTable",
+    "write_lookup_table",
+    "raster_to_cells",
+    "cells_to_raster",
     "__version__",
 ]
@@ -0,0 +1,187 @@
+from array import array
+from bisect import bisect_left
+
+from .utils import to_list
+
+try:
+    array("Q")
+    TYPECODE = "Q"
+except ValueError:  # Python 2
+    TYPECODE = "L"
+
+
+class CellSet(object):
+    """Immutable set of cells stored as a sorted array of 64-bit integers.
+
+    Each cell takes 8 bytes. Membership is answered by binary search, and
+    the set operations merge the sorted arrays linearly. Cells of mixed
+    resolutions can be stored, but membership compares exact indexes.
+
+    Parameters
+    ----------
+    cells : iterable of int, optional
+        Cells of the set, in any order and with duplicates.
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells=()):
+        # Sorting and skipping the repeated neighbors avoids a temporary set
+        cells = sorted(to_list(cells))
+        self.cells = array(TYPECODE)
+        append = self.cells.append
+        previous = None
+        for cell in cells:
+            if cell != previous:
+                append(cell)
+                previous = cell
+
+    @classmethod
+    def from_sorted(cls, cells):
+        """Create a set from cells already sorted and without duplicates.
+
+        Parameters
+        ----------
+        cells : iterable of int
+            An array of the storage type is used without copying.
+
+        Returns
+        -------
+        CellSet
+        """
+        cell_set = cls.__new__(cls)
+        if isinstance(cells, array) and cells.typecode == TYPECODE:
+            cell_set.cells = cells
+        else:
+            cell_set.cells = array(TYPECODE, to_list(cells))
+        return cell_set
+
+    def __len__(self):
+        """Return the number of cells."""
+        return len(self.cells)
+
+    def __iter__(self):
+        """Iterate over the cells in ascending order."""
+        return iter(self.cells)
+
+    def __getitem__(self, i):
+        """Return the i-th smallest cell."""
+        return self.cells[i]
+
+    def __contains__(self, cell):
+        """Return True if the cell is in the set."""
+        i = bisect_left(self.cells, cell)
+        return i < len(self.cells) and self.cells[i] == cell
+
+    def __eq__(self, other):
+        """Return True if both sets have the same cells."""
+        return isinstance(other, CellSet) and self.cells == other.cells
+
+    def __ne__(self, other):
+        """Return True if the sets have different cells."""
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Return the representation of the set."""
+        return "CellSet({0})".format(list(self.cells))
+
+    def __reduce__(self):
+        """Pickle the sorted array."""
+        return (CellSet.from_sorted, (self.cells,))
+
+    def __or__(self, other):
+        """Return the union of the sets."""
+        return self.union(other)
+
+    def __and__(self, other):
+        """Return the intersection of the sets."""
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        """Return the difference of the sets."""
+        return self.difference(other)
+
+    def union(self, other):
+        """Return the cells in either set.
+
+        Parameters
+        ----------
+        other : CellSet
+
+        Returns
+        -------
+        CellSet
+        """
+        a, b = self.cells, other.cells
+        result = array(TYPECODE)
+        append = result.append
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                append(a[i])
+                i += 1
+            elif a[i] > b[j]:
+                append(b[j])
+                j += 1
+            else:
+                append(a[i])
+                i += 1
+                j += 1
+        result.extend(a[i:])
+        result.extend(b[j:])
+        return CellSet.from_sorted(result)
+
+    def intersection(self, other):
+        """Return the cells in both sets.
+
+        Parameters
+        ----------
+        other : CellSet
+
+        Returns
+        -------
+        CellSet
+        """
+        a, b = self.cells, other.cells
+        result = array(TYPECODE)
+        append = result.append
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                i += 1
+            elif a[i] > b[j]:
+                j += 1
+            else:
+                append(a[i])
+                i += 1
+                j += 1
+        return CellSet.from_sorted(result)
+
+    def difference(self, other):
+        """Return the cells in this set but not in the other one.
+
+        Parameters
+        ----------
+        other : CellSet
+
+        Returns
+        -------
+        CellSet
+        """
+        a, b = self.cells, other.cells
+        result = array(TYPECODE)
+        append = result.append
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                append(a[i])
+                i += 1
+            elif a[i] > b[j]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        result.extend(a[i:])
+        return CellSet.from_sorted(result)
@@ -0,0 +1,226 @@
+import json
+from bisect import bisect_left, bisect_right
+
+from .main import FOOTER, RESOLUTION_MASK, cell_to_tile, get_resolution
+from .utils import compute_latitude, tile_to_longitude, to_list
+
+# Directions on the tile grid, where y grows to the south
+EAST = (1, 0)
+WEST = (-1, 0)
+NORTH = (0, -1)
+SOUTH = (0, 1)
+
+
+def cells_to_geometry(cells):
+    """Compute the outline of the union of cells as a GeoJSON MultiPolygon.
+
+    The edges of the cells are swept along each line of the tile grid of the
+    finest resolution, and only the parts with a cell on a single side are
+    kept. The boundary edges are then traced into rings, with the covered
+    side on the left, so exterior rings are counterclockwise and holes are
+    clockwise. The cost is linear in the number of cells, not in the area
+    they cover.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Cells of any resolutions. Cells contained in other cells are ignored.
+
+    Returns
+    -------
+    str
+        MultiPolygon as GeoJSON.
+    """
+    cells = set(to_list(cells))
+    if not cells:
+        return json.dumps({"type": "MultiPolygon", "coordinates": []})
+
+    resolutions = set(get_resolution(cell) for cell in cells)
+    z = max(resolutions)
+    if len(resolutions) > 1:
+        cells = [cell for cell in cells if not has_ancestor(cell, cells)]
+
+    rows = {}
+    columns = {}
+    for cell in cells:
+        x, y, cell_z = cell_to_tile(cell)
+        shift = z - cell_z
+        x0, y0 = x << shift, y << shift
+        x1, y1 = (x + 1) << shift, (y + 1) << shift
+        # Side 0 is covered south or east of the line, side 1 north or west
+        rows.setdefault(y0, []).append((x0, x1, 0))
+        rows.setdefault(y1, []).append((x0, x1, 1))
+        columns.setdefault(x0, []).append((y0, y1, 0))
+        columns.setdefault(x1, []).append((y0, y1, 1))
+
+    edges = {}
+    for y, intervals in rows.items():
+        for start, stop, side in boundary_pieces(intervals):
+            if side == 0:
+                edges[(stop, y), WEST] = (start, y)
+            else:
+                edges[(start, y), EAST] = (stop, y)
+    walls = {}
+    for x, intervals in columns.items():
+        pieces = boundary_pieces(intervals)
+        for start, stop, side in pieces:
+            if side == 0:
+                edges[(x, start), SOUTH] = (x, stop)
+            else:
+                edges[(x, stop), NORTH] = (x, start)
+        if pieces:
+            walls[x] = pieces
+
+    rings, edge_rings = trace_rings(edges)
+    exteriors = set(i for i, ring in enumerate(rings) if ring_area(ring) < 0)
+
+    # A hole belongs to the polygon of the first boundary met going west
+    # from it. That boundary may be another hole further west, so holes are
+    # resolved from west to east
+    wall_xs = sorted(walls)
+    wall_starts = dict((x, [start for start, _, _ in walls[x]]) for x in walls)
+    owners = dict((i, i) for i in exteriors)
+    holes = sorted(
+        (min(x for x, _ in ring), i)
+        for i, ring in enumerate(rings)
+        if i not in exteriors
+    )
+    for x_min, i in holes:
+        ring = rings[i]
+        y = min(
+            min(y0, y1)
+            for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:])
+            if x0 == x1 == x_min
+        )
+        for k in range(bisect_left(wall_xs, x_min) - 1, -1, -1):
+            x = wall_xs[k]
+            j = bisect_right(wall_starts[x], y) - 1
+            if j >= 0 and walls[x][j][1] > y:
+                start, stop, side = walls[x][j]
+                key = ((x, start), SOUTH) if side == 0 else ((x, stop), NORTH)
+                owners[i] = owners.get(edge_rings[key])
+                break
+
+    polygons = [[ring] for i, ring in enumerate(rings) if i in exteriors]
+    positions = dict((i, k) for k, i in enumerate(sorted(exteriors)))
+    for _, i in holes:
+        if owners.get(i) is not None:
+            polygons[positions[owners[i]]].append(rings[i])
+
+    coordinates = [
+        [
+            [[tile_to_longitude((x, 0, z), 0), compute_latitude(y, z)] for x, y in ring]
+            for ring in polygon
+        ]
+        for polygon in polygons
+    ]
+    return json.dumps({"type": "MultiPolygon", "coordinates": coordinates})
+
+
+def has_ancestor(cell, cells):
+    """Return True if a parent cell at any resolution is in the set.
+
+    Returns
+    -------
+    bool
+    """
+    masked = cell & RESOLUTION_MASK
+    for resolution in range(get_resolution(cell) - 1, -1, -1):
+        fill = (resolution << 52) | (FOOTER >> (resolution << 1))
+        if masked | fill in cells:
+            return True
+    return False
+
+
+def boundary_pieces(intervals):
+    """Sweep the cell edges of a grid line and keep those of the boundary.
+
+    Parameters
+    ----------
+    intervals : list of tuple (int, int, int)
+        Start, stop and covered side of each edge.
+
+    Returns
+    -------
+    list of tuple (int, int, int)
+        Start, stop and covered side of the boundary pieces, split at every
+        edge end.
+    """
+    events = []
+    for start, stop, side in intervals:
+        events.append((start, side, 1))
+        events.append((stop, side, -1))
+    events.sort()
+
+    pieces = []
+    counts = [0, 0]
+    previous = None
+    i = 0
+    while i < len(events):
+        position = events[i][0]
+        if previous is not None and (counts[0] > 0) != (counts[1] > 0):
+            pieces.append((previous, position, 0 if counts[0] else 1))
+        while i < len(events) and events[i][0] == position:
+            counts[events[i][1]] += events[i][2]
+            i += 1
+        previous = position
+
+    return pieces
+
+
+def trace_rings(edges):
+    """Link the boundary edges into closed rings.
+
+    At the vertices shared by two rings, the leftmost turn is taken, so the
+    rings never cross.
+
+    Parameters
+    ----------
+    edges : dict
+        End vertex of each edge, by start vertex and direction.
+
+    Returns
+    -------
+    tuple (list, dict)
+        Closed rings of the corner vertices, and the position of the ring of
+        each edge.
+    """
+    edge_rings = {}
+    rings = []
+    for start in sorted(edges):
+        if start in edge_rings:
+            continue
+
+        corners = []
+        vertex, direction = start
+        while True:
+            edge_rings[vertex, direction] = len(rings)
+            end = edges[vertex, direction]
+            dx, dy = direction
+            for turn in ((dy, -dx), direction, (-dy, dx)):
+                if (end, turn) in edges:
+                    break
+            if turn != direction:
+                corners.append(end)
+            if (end, turn) == start:
+                break
+            vertex, direction = end, turn
+
+        if corners[-1] == start[0]:
+            corners.insert(0, start[0])
+        else:
+            corners.append(corners[0])
+        rings.append(corners)
+
+    return rings, edge_rings
+
+
+def ring_area(ring):
+    """Compute twice the signed area of a ring in tile grid units.
+
+    Returns
+    -------
+    int
+        Negative for the counterclockwise rings on the map.
+    """
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]))
@@ -0,0 +1,167 @@
+import json
+
+from .main import cell_to_tile, index_to_string
+from .utils import tile_to_latitude, tile_to_longitude
+
+try:
+    from itertools import izip as zip
+    from itertools import izip_longest as zip_longest
+except ImportError:  # Python 3
+    from itertools import zip_longest
+
+POLYGON_TEMPLATE = (
+    '"geometry": {"type": "Polygon", "coordinates": '
+    "[[[{c}, {c}], [{c}, {c}], [{c}, {c}], [{c}, {c}], [{c}, {c}]]]}"
+)
+POINT_TEMPLATE = '"geometry": {"type": "Point", "coordinates": [{c}, {c}]}'
+GEOMETRIES = {"polygon": POLYGON_TEMPLATE, "point": POINT_TEMPLATE}
+
+
+def write_geojson(
+    cells,
+    fp,
+    properties=None,
+    geometry="polygon",
+    precision=9,
+    seq=False,
+    include_id=True,
+    chunk_size=10000,
+):
+    """Stream cells as GeoJSON features into a file-like object.
+
+    Each feature is built from a precompiled template, so no JSON encoder
+    is involved for the geometries. The output is written every
+    ``chunk_size`` features and the whole document is never held in memory.
+
+    Parameters
+    ----------
+    cells : iterable of int
+    fp : file-like
+        Text stream with a ``write`` method.
+    properties : dict, optional
+        Property columns by name. Each column is an iterable aligned with
+        ``cells``.
+    geometry : str, optional
+        Geometry of the features: "polygon" (default) or "point".
+    precision : int, optional
+        Number of decimals of the coordinates, by default 9.
+    seq : bool, optional
+        Write newline-delimited features (GeoJSON-seq) instead of a
+        FeatureCollection, by default False.
+    include_id : bool, optional
+        Add the hexadecimal cell as the feature id, by default True.
+    chunk_size : int, optional
+        Number of features per write, by default 10000.
+
+    Returns
+    -------
+    int
+        Number of features written.
+
+    Raises
+    ------
+    ValueError
+        If the geometry or the chunk size are not valid, or the lengths of
+        the properties and the cells differ. The features before the
+        mismatch are already written.
+    """
+    geometry = geometry.lower()
+    if geometry not in GEOMETRIES:
+        raise ValueError("Wrong geometry argument passed to write_geojson")
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size")
+
+    template = GEOMETRIES[geometry].replace("{c}", "%.{0}f".format(int(precision)))
+
+    names = []
+    columns = []
+    for name, column in sorted((properties or {}).items()):
+        names.append(json.dumps(str(name)) + ": ")
+        columns.append(column.tolist() if hasattr(column, "tolist") else column)
+
+    if hasattr(cells, "tolist"):
+        cells = cells.tolist()
+
+    separator = "\n" if seq else ", "
+    if not seq:
+        fp.write('{"type": "FeatureCollection", "features": [')
+
+    count = 0
+    chunk = []
+    missing = object()
+    for row in zip_longest(cells, *columns, fillvalue=missing):
+        if any(value is missing for value in row):
+            raise ValueError("Invalid properties: should have one value per cell")
+        cell = row[0]
+        chunk.append(
+            '{"type": "Feature", '
+            + ('"id": "%s", ' % index_to_string(cell) if include_id else "")
+            + template % cell_coordinates(cell, geometry)
+            + ', "properties": {'
+            + ", ".join([name + encode_value(v) for name, v in zip(names, row[1:])])
+            + "}}"
+        )
+        if len(chunk) == chunk_size:
+            if count:
+                fp.write(separator)
+            fp.write(separator.join(chunk))
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        if count:
+            fp.write(separator)
+        fp.write(separator.join(chunk))
+        count += len(chunk)
+
+    if seq:
+        if count:
+            fp.write("\n")
+    else:
+        fp.write("]}")
+
+    return count
+
+
+def cell_coordinates(cell, geometry):
+    """Return the flat coordinates of a cell geometry.
+
+    Returns
+    -------
+    tuple
+    """
+    tile = cell_to_tile(cell)
+
+    if geometry == "point":
+        return (tile_to_longitude(tile, 0.5), tile_to_latitude(tile, 0.5))
+
+    xmin = tile_to_longitude(tile, 0)
+    xmax = tile_to_longitude(tile, 1)
+    ymin = tile_to_latitude(tile, 1)
+    ymax = tile_to_latitude(tile, 0)
+
+    return (xmin, ymax, xmin, ymin, xmax, ymin, xmax, ymax, xmin, ymax)
+
+
+def encode_value(value):
+    """Encode a property value as a JSON literal.
+
+    Returns
+    -------
+    str
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            return "null"
+        return repr(float(value))
+    if isinstance(value, int):
+        return str(value)
+    if hasattr(value, "item"):
+        return encode_value(value.item())
+    return json.dumps(value)
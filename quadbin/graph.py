@@ -0,0 +1,92 @@
+from array import array
+
+from .cellset import TYPECODE
+from .main import get_resolution, sibling_masks
+from .utils import to_list
+
+CONNECTIVITIES = (4, 8)
+
+
+def cells_adjacency(cells, connectivity=4):
+    """Compute the adjacency graph of cells in compressed sparse row layout.
+
+    The neighbors are found by adding offsets to the interleaved bits of
+    each cell and looking them up in a table of positions, so the cells
+    are never decoded into tiles. As in ``cell_sibling``, the grid does not
+    wrap around its edges.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Distinct cells at the same resolution.
+    connectivity : int, optional
+        4 for the cells sharing an edge (default), or 8 to add the cells
+        sharing a corner.
+
+    Returns
+    -------
+    tuple (array, array)
+        Offsets and neighbor positions: the neighbors of the i-th cell are
+        ``indices[indptr[i]:indptr[i + 1]]``, in ascending order.
+
+    Raises
+    ------
+    ValueError
+        If the connectivity is not valid, or the cells are repeated or have
+        different resolutions.
+    """
+    if connectivity not in CONNECTIVITIES:
+        raise ValueError("Wrong connectivity argument passed to cells_adjacency")
+
+    cells = to_list(cells)
+    positions = {}
+    for position, cell in enumerate(cells):
+        if positions.setdefault(cell, position) != position:
+            raise ValueError("Invalid cells: repeated cell {0}".format(cell))
+
+    resolutions = set(get_resolution(cell) for cell in cells)
+    if len(resolutions) > 1:
+        raise ValueError("Invalid resolution: cells should have the same resolution")
+
+    indptr = array(TYPECODE, [0])
+    indices = array(TYPECODE)
+    resolution = resolutions.pop() if resolutions else 0
+    if resolution == 0:
+        indptr.extend([0] * len(cells))
+        return indptr, indices
+
+    x_mask, y_mask, x_unit, y_unit = sibling_masks(resolution)
+    get = positions.get
+    for cell in cells:
+        x = cell & x_mask
+        y = cell & y_mask
+        base = cell ^ x ^ y
+
+        # Columns and rows of the neighborhood, without wrapping
+        xs = [x]
+        if x:
+            xs.append((x - x_unit) & x_mask)
+        if x != x_mask:
+            xs.append(((x | y_mask) + x_unit) & x_mask)
+        ys = [y]
+        if y:
+            ys.append((y - y_unit) & y_mask)
+        if y != y_mask:
+            ys.append(((y | x_mask) + y_unit) & y_mask)
+
+        if connectivity == 4:
+            neighbors = [base | other | y for other in xs[1:]]
+            neighbors += [base | x | other for other in ys[1:]]
+        else:
+            neighbors = [base | i | j for i in xs for j in ys]
+            neighbors.remove(cell)
+
+        found = sorted(
+            position
+            for position in (get(neighbor) for neighbor in neighbors)
+            if position is not None
+        )
+        indices.extend(found)
+        indptr.append(len(indices))
+
+    return indptr, indices
@@ -0,0 +1,287 @@
+import json
+from array import array
+from bisect import bisect_left
+
+from .cellset import TYPECODE
+from .main import (
+    FOOTER,
+    RESOLUTION_MASK,
+    geometry_to_cells,
+    get_resolution,
+    points_to_cells,
+)
+from .utils import to_list
+
+
+class ContainmentIndex(object):
+    """Index of a mixed-resolution cover to find the cells containing others.
+
+    A query walks the ancestors of the cell from the finest resolution of
+    the cover upward, only at the resolutions present in the cover, and
+    looks each of them up in a hash set. That is at most 27 lookups.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Cells of the cover, of any resolutions.
+    """
+
+    def __init__(self, cells):
+        self.cells = frozenset(to_list(cells))
+        resolutions = sorted(set(get_resolution(cell) for cell in self.cells))
+        self.parent_fills = [
+            (resolution, (resolution << 52) | (FOOTER >> (resolution << 1)))
+            for resolution in reversed(resolutions)
+        ]
+        self.resolution = resolutions[-1] if resolutions else 0
+
+    def __len__(self):
+        """Return the number of cells of the cover."""
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        """Return True if a cell of the cover contains the cell."""
+        return self.containing_cell(cell) is not None
+
+    def containing_cell(self, cell):
+        """Find the finest cell of the cover that contains a cell.
+
+        Parameters
+        ----------
+        cell : int
+
+        Returns
+        -------
+        int
+            The containing cell, or None if the cell is not covered.
+        """
+        cells = self.cells
+        resolution = get_resolution(cell)
+        masked = cell & RESOLUTION_MASK
+        for parent_resolution, fill in self.parent_fills:
+            if parent_resolution <= resolution:
+                parent = masked | fill
+                if parent in cells:
+                    return parent
+        return None
+
+    def containing_cells(self, cells):
+        """Find the finest cells of the cover that contain many cells.
+
+        Parameters
+        ----------
+        cells : iterable of int
+
+        Returns
+        -------
+        list
+            The containing cell of each cell, or None if it is not covered.
+        """
+        containing_cell = self.containing_cell
+        return [containing_cell(cell) for cell in to_list(cells)]
+
+    def points_containing_cells(self, longitudes, latitudes):
+        """Find the finest cells of the cover that contain many points.
+
+        Parameters
+        ----------
+        longitudes : iterable of float
+            Longitudes in decimal degrees.
+        latitudes : iterable of float
+            Latitudes in decimal degrees.
+
+        Returns
+        -------
+        list
+            The containing cell of each point, or None if it is not covered.
+        """
+        return self.containing_cells(
+            points_to_cells(longitudes, latitudes, self.resolution)
+        )
+
+
+class CoverIndex(object):
+    """Spatial join index from the cells of many features to their ids.
+
+    Every feature is filled with ``geometry_to_cells`` and the cell to
+    feature mapping is stored in compressed sparse row layout: a sorted
+    array of distinct cells, an array of offsets, and the array of feature
+    positions of each cell. Points are joined by converting them into
+    cells and searching the sorted cells.
+
+    Parameters
+    ----------
+    geometries : iterable of str
+        Geometries of the features as GeoJSON.
+    resolution : int
+        The resolution of the cells.
+    ids : iterable, optional
+        Ids of the features, by default their positions.
+    flag_boundary : bool, optional
+        Flag the cells that intersect the boundary of the features, so the
+        caller can refine them with the exact geometry, by default False.
+
+    Raises
+    ------
+    ValueError
+        If the number of ids does not match the number of geometries.
+    """
+
+    def __init__(self, geometries, resolution, ids=None, flag_boundary=False):
+        geometries = to_list(geometries)
+        self.ids = list(range(len(geometries))) if ids is None else to_list(ids)
+        self.resolution = resolution
+
+        if len(self.ids) != len(geometries):
+            raise ValueError("Invalid ids: should have one id per geometry")
+
+        cells = array(TYPECODE)
+        features = array(TYPECODE)
+        boundary = array("B")
+        for position, geometry in enumerate(geometries):
+            feature_cells = array(
+                TYPECODE, sorted(geometry_to_cells(geometry, resolution))
+            )
+            cells.extend(feature_cells)
+            features.extend(array(TYPECODE, [position]) * len(feature_cells))
+            if flag_boundary:
+                boundary_geometry = geometry_boundary(json.loads(geometry))
+                boundary_cells = array(
+                    TYPECODE,
+                    sorted(
+                        geometry_to_cells(json.dumps(boundary_geometry), resolution)
+                    ),
+                )
+                boundary.extend(boundary_flags(feature_cells, boundary_cells))
+            else:
+                boundary.extend(array("B", [0]) * len(feature_cells))
+
+        # The sort is stable, so the features of a cell stay in position order
+        order = sorted(range(len(cells)), key=cells.__getitem__)
+        self.cells = array(TYPECODE)
+        self.offsets = array(TYPECODE, [0])
+        self.features = array(TYPECODE, [features[i] for i in order])
+        self.boundary = array("B", [boundary[i] for i in order])
+        for k, i in enumerate(order):
+            cell = cells[i]
+            if not self.cells or self.cells[-1] != cell:
+                if self.cells:
+                    self.offsets.append(k)
+                self.cells.append(cell)
+        if self.cells:
+            self.offsets.append(len(order))
+
+    def __len__(self):
+        """Return the number of distinct cells."""
+        return len(self.cells)
+
+    def cell_features(self, cell):
+        """Find the features of a cell.
+
+        Parameters
+        ----------
+        cell : int
+            Cell at the resolution of the index.
+
+        Returns
+        -------
+        list
+            Ids of the features.
+        """
+        i = bisect_left(self.cells, cell)
+        if i == len(self.cells) or self.cells[i] != cell:
+            return []
+        start = self.offsets[i]
+        stop = self.offsets[i + 1]
+        return [self.ids[position] for position in self.features[start:stop]]
+
+    def join_points(self, longitudes, latitudes):
+        """Join many points with the features whose cells contain them.
+
+        Parameters
+        ----------
+        longitudes : iterable of float
+            Longitudes in decimal degrees.
+        latitudes : iterable of float
+            Latitudes in decimal degrees.
+
+        Returns
+        -------
+        tuple (list, list, list)
+            Position of the point, id of the feature, and whether the cell
+            is on the boundary of the feature, for each match.
+        """
+        cells, offsets, features = self.cells, self.offsets, self.features
+        boundary, ids = self.boundary, self.ids
+        size = len(cells)
+
+        points = []
+        matches = []
+        flags = []
+        for point, cell in enumerate(
+            points_to_cells(longitudes, latitudes, self.resolution)
+        ):
+            i = bisect_left(cells, cell)
+            if i == size or cells[i] != cell:
+                continue
+            for j in range(offsets[i], offsets[i + 1]):
+                points.append(point)
+                matches.append(ids[features[j]])
+                flags.append(bool(boundary[j]))
+
+        return points, matches, flags
+
+
+def boundary_flags(cells, boundary_cells):
+    """Flag the cells of a feature that are on its boundary.
+
+    Parameters
+    ----------
+    cells : array of int
+        Sorted cells of the feature.
+    boundary_cells : array of int
+        Sorted cells of the boundary of the feature.
+
+    Returns
+    -------
+    array of int
+        1 for the cells on the boundary, 0 for the others.
+    """
+    flags = array("B", [0]) * len(cells)
+    size = len(boundary_cells)
+    j = 0
+    for i, cell in enumerate(cells):
+        j = bisect_left(boundary_cells, cell, j)
+        if j == size:
+            break
+        if boundary_cells[j] == cell:
+            flags[i] = 1
+    return flags
+
+
+def geometry_boundary(geometry):
+    """Return the boundary of the polygons of a GeoJSON geometry.
+
+    Other geometries are returned as they are.
+
+    Returns
+    -------
+    dict
+    """
+    geom_type = geometry["type"]
+
+    if geom_type == "Polygon":
+        return {"type": "MultiLineString", "coordinates": geometry["coordinates"]}
+    if geom_type == "MultiPolygon":
+        return {
+            "type": "MultiLineString",
+            "coordinates": [
+                ring for polygon in geometry["coordinates"] for ring in polygon
+            ],
+        }
+    if geom_type == "GeometryCollection":
+        return {
+            "type": "GeometryCollection",
+            "geometries": [geometry_boundary(geom) for geom in geometry["geometries"]],
+        }
+    return geometry
@@ -0,0 +1,263 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from .cellset import TYPECODE
+from .main import FOOTER, RESOLUTION_MASK, get_resolution, points_to_cells
+from .utils import check_lengths, to_list
+
+MAGIC = b"QBLT"
+VERSION = 1
+
+# magic, version, mask of the resolutions present, number of cells
+HEADER_FORMAT = "<4sBxxxIQxxxx"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+def write_lookup_table(cells, values, path):
+    """Write a sorted cell to value table file for ``LookupTable``.
+
+    The file has a header followed by the sorted cells and their values,
+    both as little-endian 64-bit unsigned integers. Values are typically
+    offsets into a separate store of records.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Distinct cells, of any resolutions.
+    values : iterable of int
+        Value of each cell, from 0 to 2^64 - 1.
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    int
+        Number of cells written.
+
+    Raises
+    ------
+    ValueError
+        If there are repeated cells or the numbers of cells and values
+        differ. Nothing is written then.
+    """
+    cells = to_list(cells)
+    values = to_list(values)
+    check_lengths("Invalid values: should have one value per cell", cells, values)
+    pairs = sorted(zip(cells, values))
+    keys = array(TYPECODE, [cell for cell, _ in pairs])
+    offsets = array(TYPECODE, [value for _, value in pairs])
+
+    resolutions = 0
+    for i, cell in enumerate(keys):
+        if i and keys[i - 1] == cell:
+            raise ValueError("Invalid cells: repeated cell {0}".format(cell))
+        resolutions |= 1 << get_resolution(cell)
+
+    if sys.byteorder != "little":
+        keys.byteswap()
+        offsets.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, resolutions, len(keys)))
+        keys.tofile(f)
+        offsets.tofile(f)
+
+    return len(keys)
+
+
+class LookupTable(object):
+    """Read-only memory-mapped table from cells to values.
+
+    Opening the file only maps it and reads its header, whatever its size,
+    and processes mapping the same file share its pages through the page
+    cache. Lookups are binary searches on the mapped sorted cells.
+
+    Parameters
+    ----------
+    path : str
+        Path of a file written by ``write_lookup_table``.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid lookup table.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mmap) < HEADER_SIZE:
+            self.close()
+            raise ValueError("Invalid lookup table: truncated header")
+        magic, version, resolutions, count = struct.unpack_from(
+            HEADER_FORMAT, self.mmap
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Invalid lookup table: unknown format")
+        if len(self.mmap) < HEADER_SIZE + 16 * count:
+            self.close()
+            raise ValueError("Invalid lookup table: truncated data")
+
+        self.count = count
+        self.keys = packed_array(self.mmap, HEADER_SIZE, count)
+        self.values = packed_array(self.mmap, HEADER_SIZE + 8 * count, count)
+
+        self.parent_fills = [
+            (resolution, (resolution << 52) | (FOOTER >> (resolution << 1)))
+            for resolution in range(26, -1, -1)
+            if resolutions & (1 << resolution)
+        ]
+        self.resolution = self.parent_fills[0][0] if self.parent_fills else 0
+
+    def __enter__(self):
+        """Return the table."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the table."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of cells."""
+        return self.count
+
+    def __contains__(self, cell):
+        """Return True if the cell is in the table."""
+        return self.find(cell) >= 0
+
+    def close(self):
+        """Unmap the file."""
+        for view in (getattr(self, "keys", None), getattr(self, "values", None)):
+            if isinstance(view, memoryview):
+                view.release()
+        self.keys = self.values = None
+        self.mmap.close()
+
+    def find(self, cell):
+        """Return the position of a cell in the table, or -1 if it is missing.
+
+        Returns
+        -------
+        int
+        """
+        i = bisect_left(self.keys, cell)
+        if i < self.count and self.keys[i] == cell:
+            return i
+        return -1
+
+    def get(self, cell, default=None):
+        """Read the value of a cell.
+
+        Parameters
+        ----------
+        cell : int
+        default : optional
+            Value returned if the cell is missing, by default None.
+
+        Returns
+        -------
+        int
+        """
+        i = self.find(cell)
+        return self.values[i] if i >= 0 else default
+
+    def get_many(self, cells, default=None):
+        """Read the values of many cells.
+
+        Parameters
+        ----------
+        cells : iterable of int
+        default : optional
+            Value returned for the missing cells, by default None.
+
+        Returns
+        -------
+        list
+        """
+        return [self.get(cell, default) for cell in to_list(cells)]
+
+    def containing_value(self, cell, default=None):
+        """Read the value of the finest cell of the table containing a cell.
+
+        The ancestors of the cell are only looked up at the resolutions
+        present in the table.
+
+        Parameters
+        ----------
+        cell : int
+        default : optional
+            Value returned if no cell contains it, by default None.
+
+        Returns
+        -------
+        int
+        """
+        resolution = get_resolution(cell)
+        masked = cell & RESOLUTION_MASK
+        for parent_resolution, fill in self.parent_fills:
+            if parent_resolution <= resolution:
+                i = self.find(masked | fill)
+                if i >= 0:
+                    return self.values[i]
+        return default
+
+    def points_values(self, longitudes, latitudes, default=None):
+        """Read the values of the finest cells of the table containing points.
+
+        Parameters
+        ----------
+        longitudes : iterable of float
+            Longitudes in decimal degrees.
+        latitudes : iterable of float
+            Latitudes in decimal degrees.
+        default : optional
+            Value returned for the points not covered, by default None.
+
+        Returns
+        -------
+        list
+        """
+        return [
+            self.containing_value(cell, default)
+            for cell in points_to_cells(longitudes, latitudes, self.resolution)
+        ]
+
+
+class PackedArray(object):
+    """Sequence of little-endian 64-bit unsigned integers in a buffer."""
+
+    def __init__(self, buffer, offset, count):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        """Return the number of integers."""
+        return self.count
+
+    def __getitem__(self, i):
+        """Read the i-th integer."""
+        if i < 0 or i >= self.count:
+            raise IndexError("PackedArray index out of range")
+        return struct.unpack_from("<Q", self.buffer, self.offset + 8 * i)[0]
+
+
+def packed_array(buffer, offset, count):
+    """View 64-bit unsigned integers of a buffer as a sequence, without copying.
+
+    A native memoryview is used when the platform allows it.
+
+    Returns
+    -------
+    sequence of int
+    """
+    if hasattr(memoryview, "cast") and sys.byteorder == "little":
+        start = offset
+        stop = offset + 8 * count
+        return memoryview(buffer)[start:stop].cast("Q")
+    return PackedArray(buffer, offset, count)
@@ -1,21 +1,41 @@
+from __future__ import division
+
+import binascii
 import json
+import math
+import struct
+from bisect import bisect_left, bisect_right
+from collections import Counter
 
-from .tilecover import get_tiles
+from .tilecover import get_tiles, get_tiles_spans, merge_spans
 from .utils import (
+    AGGREGATORS,
     DIRECTIONS,
+    DOWN,
+    EARTH_RADIUS,
+    LEFT,
+    UP,
+    check_lengths,
+    circle_longitude_extent,
     clip_latitude,
     clip_longitude,
+    compute_latitude,
     distinct,
+    mercator_to_tile,
     point_to_tile,
+    point_to_tile_fraction,
     tile_k_ring,
     tile_sibling,
     tile_to_longitude,
     tile_to_latitude,
+    row_area,
     tile_area,
+    to_list,
 )
 
 HEADER = 0x4000000000000000
 FOOTER = 0xFFFFFFFFFFFFF
+RESOLUTION_MASK = ~(0x1F << 52)
 B = [
     0x5555555555555555,
     0x3333333333333333,
@@ -25,6 +45,10 @@ B = [
     0x00000000FFFFFFFF,
 ]
 S = [1, 2, 4, 8, 16]
+# Bits of the x coordinate in the cell, clearing them groups cells by row
+X_BITS = 0x5555555555555
+
+POINTS_LENGTH_ERROR = "Invalid points: should have as many longitudes as latitudes"
 
 
 def is_valid_index(index):
@@ -216,6 +240,166 @@ def point_to_cell(longitude, latitude, resolution):
     return tile_to_cell(tile)
 
 
+def points_to_cells(longitudes, latitudes, resolution):
+    """Convert many geographic points into cells.
+
+    Parameters
+    ----------
+    longitudes : iterable of float
+        Longitudes in decimal degrees.
+    latitudes : iterable of float
+        Latitudes in decimal degrees.
+    resolution : int
+        The resolution of the cells.
+
+    Returns
+    -------
+    list
+        Cell of each point.
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds, or the numbers of longitudes and
+        latitudes differ.
+    """
+    if resolution < 0 or resolution > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+
+    longitudes = to_list(longitudes)
+    latitudes = to_list(latitudes)
+    check_lengths(POINTS_LENGTH_ERROR, longitudes, latitudes)
+
+    return [
+        tile_to_cell(
+            point_to_tile(
+                clip_longitude(longitude), clip_latitude(latitude), resolution
+            )
+        )
+        for longitude, latitude in zip(longitudes, latitudes)
+    ]
+
+
+def mercator_to_cell(x, y, resolution):
+    """Convert a Web Mercator point into a cell.
+
+    Parameters
+    ----------
+    x : float
+        Easting in meters (EPSG:3857).
+    y : float
+        Northing in meters (EPSG:3857).
+    resolution : int
+        The resolution of the cell.
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds.
+    """
+    if resolution < 0 or resolution > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+
+    return tile_to_cell(mercator_to_tile(x, y, resolution))
+
+
+def mercator_to_cells(xs, ys, resolution):
+    """Convert many Web Mercator points into cells.
+
+    Parameters
+    ----------
+    xs : iterable of float
+        Eastings in meters (EPSG:3857).
+    ys : iterable of float
+        Northings in meters (EPSG:3857).
+    resolution : int
+        The resolution of the cells.
+
+    Returns
+    -------
+    list
+        Cell of each point.
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds or the numbers of xs and ys
+        differ.
+    """
+    if resolution < 0 or resolution > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+
+    xs = to_list(xs)
+    ys = to_list(ys)
+    check_lengths("Invalid points: should have as many xs as ys", xs, ys)
+    return [tile_to_cell(mercator_to_tile(x, y, resolution)) for x, y in zip(xs, ys)]
+
+
+def points_to_cell_counts(longitudes, latitudes, resolution, weights=None):
+    """Bin many geographic points into cells.
+
+    Points are counted by tile, so each distinct cell is only encoded once.
+
+    Parameters
+    ----------
+    longitudes : iterable of float
+        Longitudes in decimal degrees.
+    latitudes : iterable of float
+        Latitudes in decimal degrees.
+    resolution : int
+        The resolution of the cells.
+    weights : iterable of float, optional
+        Weight of each point. By default, the points are counted.
+
+    Returns
+    -------
+    tuple (list, list)
+        Distinct cells in ascending order, and the count or the sum of the
+        weights of their points.
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds, or the numbers of longitudes,
+        latitudes and weights differ.
+    """
+    if resolution < 0 or resolution > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+
+    longitudes = to_list(longitudes)
+    latitudes = to_list(latitudes)
+    check_lengths(POINTS_LENGTH_ERROR, longitudes, latitudes)
+    if weights is not None:
+        weights = to_list(weights)
+        check_lengths(
+            "Invalid weights: should have one weight per point", longitudes, weights
+        )
+
+    tiles = [
+        point_to_tile(clip_longitude(longitude), clip_latitude(latitude), resolution)
+        for longitude, latitude in zip(longitudes, latitudes)
+    ]
+
+    if weights is None:
+        totals = Counter((x << 32) | y for x, y, _ in tiles)
+    else:
+        totals = {}
+        for (x, y, _), weight in zip(tiles, weights):
+            key = (x << 32) | y
+            totals[key] = totals.get(key, 0) + weight
+
+    bins = sorted(
+        (tile_to_cell((key >> 32, key & 0xFFFFFFFF, resolution)), total)
+        for key, total in totals.items()
+    )
+
+    return [cell for cell, _ in bins], [total for _, total in bins]
+
+
 def cell_to_boundary(cell, geojson=False):
     """Convert a cell into a geographic polygon.
 
@@ -314,6 +498,208 @@ def string_to_index(index):
     return int(index, base=16)
 
 
+def indexes_to_strings(indexes, as_bytes=False):
+    """Convert many indexes into their 16-char string representations.
+
+    Parameters
+    ----------
+    indexes : iterable of int
+    as_bytes : bool, optional
+        Return a single contiguous buffer of 16-byte ASCII records,
+        by default False.
+
+    Returns
+    -------
+    list
+        The hexadecimal representations of the indexes.
+    bytes
+        if as_bytes is True.
+
+    Raises
+    ------
+    ValueError
+        If any index does not fit in 64 bits.
+    """
+    indexes = to_list(indexes)
+
+    try:
+        buffer = binascii.hexlify(struct.pack(">%dQ" % len(indexes), *indexes))
+    except struct.error:
+        raise ValueError("Invalid index: should be a 64-bit unsigned integer")
+
+    if as_bytes:
+        return buffer
+
+    strings = buffer.decode("ascii")
+    starts = range(0, len(strings), 16)
+    stops = range(16, len(strings) + 16, 16)
+    return [strings[start:stop] for start, stop in zip(starts, stops)]
+
+
+def strings_to_indexes(strings, validate=True):
+    """Convert many 16-char string representations into indexes.
+
+    Parameters
+    ----------
+    strings : iterable of str, array of S16 or U16, or bytes
+        Hexadecimal strings, or a contiguous buffer of 16-byte records.
+    validate : bool, optional
+        Check that every result is a valid index, by default True.
+
+    Returns
+    -------
+    list
+        The decimal representations of the strings.
+
+    Raises
+    ------
+    ValueError
+        If any string is not a 16-char hexadecimal number, or any index
+        is not valid.
+    """
+    dtype = getattr(strings, "dtype", None)
+    if dtype is not None and dtype.kind in ("S", "U"):
+        # Unicode arrays take 4 bytes per character
+        if dtype.itemsize != (16 if dtype.kind == "S" else 64):
+            raise ValueError("Invalid index string: should have 16 characters")
+        strings = strings.astype("S16").tobytes()
+        # Shorter strings are padded with null characters
+        if b"\0" in strings:
+            raise ValueError("Invalid index string: should have 16 characters")
+
+    if isinstance(strings, (bytes, bytearray, memoryview)):
+        buffer = bytes(strings)
+    else:
+        strings = to_list(strings)
+        if set(map(len, strings)) - set([16]):
+            raise ValueError("Invalid index string: should have 16 characters")
+        buffer = "".join(strings).encode("ascii")
+
+    if len(buffer) % 16:
+        raise ValueError("Invalid index buffer: should have 16-byte records")
+
+    try:
+        indexes = list(
+            struct.unpack(">%dQ" % (len(buffer) >> 4), binascii.unhexlify(buffer))
+        )
+    except (binascii.Error, TypeError, ValueError):
+        raise ValueError("Invalid index string: should be hexadecimal")
+
+    if validate:
+        check_indexes(indexes)
+
+    return indexes
+
+
+def check_indexes(indexes):
+    """Check that all the indexes are valid.
+
+    The header of each distinct mode and resolution is only checked once.
+
+    Parameters
+    ----------
+    indexes : list of int
+
+    Raises
+    ------
+    ValueError
+        If any index is not valid.
+    """
+    headers = {}
+    for index in indexes:
+        header = index >> 52
+        unused = headers.get(header)
+        if unused is None:
+            if not is_valid_index((header << 52) | FOOTER):
+                raise ValueError("Invalid index: {0}".format(index))
+            unused = headers[header] = FOOTER >> ((header & 0x1F) << 2)
+        if index & unused != unused:
+            raise ValueError("Invalid index: {0}".format(index))
+
+
+def indexes_to_int64(indexes):
+    """Convert indexes into signed 64-bit integers.
+
+    Valid indexes never set the sign bit, so their values are kept. NumPy
+    and Arrow arrays are reinterpreted without copying their data.
+
+    Parameters
+    ----------
+    indexes : iterable of int, or array of uint64
+
+    Returns
+    -------
+    list
+        if indexes is not an array.
+    array
+        Array of int64, if indexes is a NumPy or Arrow array.
+
+    Raises
+    ------
+    ValueError
+        If any index does not fit in 64 bits, or the array is not of 64-bit
+        integers.
+    """
+    return reinterpret_int64(indexes, signed=True)
+
+
+def int64_to_indexes(values):
+    """Convert signed 64-bit integers into indexes.
+
+    Parameters
+    ----------
+    values : iterable of int, or array of int64
+
+    Returns
+    -------
+    list
+        if values is not an array.
+    array
+        Array of uint64, if values is a NumPy or Arrow array.
+
+    Raises
+    ------
+    ValueError
+        If any value does not fit in 64 bits, or the array is not of 64-bit
+        integers.
+    """
+    return reinterpret_int64(values, signed=False)
+
+
+def reinterpret_int64(values, signed):
+    """Reinterpret 64-bit integers as signed or unsigned.
+
+    Returns
+    -------
+    list or array
+    """
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and dtype.kind in ("i", "u"):
+        if dtype.itemsize != 8:
+            raise ValueError("Invalid index: should be a 64-bit integer")
+        return values.view("int64" if signed else "uint64")
+
+    if hasattr(values, "to_pylist"):
+        import pyarrow
+
+        value_type = values.type
+        if not pyarrow.types.is_integer(value_type) or value_type.bit_width != 64:
+            raise ValueError("Invalid index: should be a 64-bit integer")
+        target = pyarrow.int64() if signed else pyarrow.uint64()
+        if hasattr(values, "chunks"):
+            return pyarrow.chunked_array(
+                [chunk.view(target) for chunk in values.chunks], target
+            )
+        return values.view(target)
+
+    values = to_list(values)
+    if values and (min(values) < -(1 << 63) or max(values) >= (1 << 64)):
+        raise ValueError("Invalid index: should be a 64-bit integer")
+    if signed:
+        return [value - (1 << 64) if value >= (1 << 63) else value for value in values]
+    return [value + (1 << 64) if value < 0 else value for value in values]
+
+
 def k_ring(origin, k):
     """Compute the indices within k distance of the origin index.
 
@@ -373,6 +759,99 @@ def k_ring_distances(origin, k):
     ]
 
 
+def k_ring_aggregate(cells, values, k, op="sum"):
+    """Aggregate the values within k distance of each cell.
+
+    The cells are sorted by row and column once. The neighbors of a cell
+    are then found with binary searches on the 2k + 1 rows around it, and
+    the sums and counts are read from the prefix sums of each row.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Cells with the same resolution. Values of repeated cells are added.
+    values : iterable of float
+        Value of each cell.
+    k : int
+        Distance of the ring.
+    op : str, optional
+        Aggregation of the values in the k-ring of each cell: "sum"
+        (default), "count", "min", "max" or "mean". Cells without value are
+        ignored.
+
+    Returns
+    -------
+    list
+        Aggregate for each cell.
+
+    Raises
+    ------
+    ValueError
+        If the k distance is negative, the operation is not valid, the
+        cells have different resolutions, or the numbers of cells and values
+        differ.
+    """
+    if k < 0:
+        raise ValueError("Invalid negative distance")
+    if op not in AGGREGATORS:
+        raise ValueError("Wrong op argument passed to k_ring_aggregate")
+
+    cells = to_list(cells)
+    values = to_list(values)
+    check_lengths("Invalid values: should have one value per cell", cells, values)
+
+    tiles = [cell_to_tile(cell) for cell in cells]
+    if len(set(z for _, _, z in tiles)) > 1:
+        raise ValueError("Invalid resolution: cells should have the same resolution")
+
+    totals = {}
+    for (x, y, _), value in zip(tiles, values):
+        totals[(y, x)] = totals.get((y, x), 0) + value
+
+    rows = {}
+    for (y, x), value in sorted(totals.items()):
+        row = rows.get(y)
+        if row is None:
+            row = rows[y] = ([], [], [0])
+        row[0].append(x)
+        row[1].append(value)
+        row[2].append(row[2][-1] + value)
+
+    aggregates = []
+    for x, y, _ in tiles:
+        total = 0
+        count = 0
+        extremes = []
+        for ring_y in range(y - k, y + k + 1):
+            row = rows.get(ring_y)
+            if row is None:
+                continue
+            xs, row_values, prefix = row
+            start = bisect_left(xs, x - k)
+            stop = bisect_right(xs, x + k)
+            if start == stop:
+                continue
+            total += prefix[stop] - prefix[start]
+            count += stop - start
+            if op == "min":
+                extremes.append(min(row_values[start:stop]))
+            elif op == "max":
+                extremes.append(max(row_values[start:stop]))
+
+        if op == "sum":
+            aggregates.append(total)
+        elif op == "count":
+            aggregates.append(count)
+        elif op == "mean":
+            aggregates.append(total / count)
+        elif op == "min":
+            aggregates.append(min(extremes))
+        else:
+            aggregates.append(max(extremes))
+
+    return aggregates
+
+
 def cell_sibling(cell, direction):
     """Compute the sibling cell in a specific direction.
 
@@ -401,6 +880,197 @@ def cell_sibling(cell, direction):
     return tile_to_cell(tile_sibling(tile, direction))
 
 
+def cell_siblings(cells, direction=None):
+    """Compute the sibling cells of many cells.
+
+    The siblings are computed on the interleaved bits of the cells, without
+    decoding them into tiles. Cells on the edges of the grid, which does not
+    wrap, have no sibling: their result is 0 and they are flagged as
+    invalid.
+
+    Parameters
+    ----------
+    cells : iterable of int
+    direction : str or int, optional
+        Location of the siblings: "up", "right", "left", "down", or their
+        codes 0, 1, 2 and 3. By default, all the directions.
+
+    Returns
+    -------
+    tuple (list, list)
+        Siblings and whether they are valid, if a direction is passed.
+    tuple (dict, dict)
+        Siblings and whether they are valid by direction name, if no
+        direction is passed.
+
+    Raises
+    ------
+    ValueError
+        If a wrong direction is passed.
+    """
+    codes = dict((code, name) for name, code in DIRECTIONS.items())
+    if direction is None:
+        directions = sorted(codes)
+    elif direction in codes:
+        directions = [direction]
+    elif hasattr(direction, "lower") and direction.lower() in DIRECTIONS:
+        directions = [DIRECTIONS[direction.lower()]]
+    else:
+        raise ValueError("Wrong direction argument passed to sibling")
+
+    cells = to_list(cells)
+    siblings = dict((code, []) for code in directions)
+    valid = dict((code, []) for code in directions)
+    masks = {}
+    for cell in cells:
+        resolution = (cell >> 52) & 0x1F
+        if resolution not in masks:
+            masks[resolution] = sibling_masks(resolution)
+        x_mask, y_mask, x_unit, y_unit = masks[resolution]
+        x = cell & x_mask
+        y = cell & y_mask
+
+        for code in directions:
+            if resolution == 0:
+                sibling = 0
+            elif code == UP:
+                sibling = cell ^ y ^ ((y - y_unit) & y_mask) if y else 0
+            elif code == DOWN:
+                sibling = (
+                    cell ^ y ^ (((y | x_mask) + y_unit) & y_mask) if y != y_mask else 0
+                )
+            elif code == LEFT:
+                sibling = cell ^ x ^ ((x - x_unit) & x_mask) if x else 0
+            else:
+                sibling = (
+                    cell ^ x ^ (((x | y_mask) + x_unit) & x_mask) if x != x_mask else 0
+                )
+            siblings[code].append(sibling)
+            valid[code].append(sibling != 0)
+
+    if direction is not None:
+        return siblings[directions[0]], valid[directions[0]]
+    return (
+        dict((codes[code], siblings[code]) for code in directions),
+        dict((codes[code], valid[code]) for code in directions),
+    )
+
+
+def sibling_masks(resolution):
+    """Compute the masks to move cells of a resolution on the grid.
+
+    The x and y bits of a cell are interleaved, so a sibling is found by
+    adding or subtracting one unit to the bits of a single coordinate,
+    filling the bits of the other one to carry through them.
+
+    Parameters
+    ----------
+    resolution : int
+
+    Returns
+    -------
+    tuple (int, int, int, int)
+        Mask of the x bits, mask of the y bits, and the units of x and y.
+    """
+    used = FOOTER ^ (FOOTER >> (resolution << 1))
+    unit = 1 << (52 - (resolution << 1))
+    return X_BITS & used, (X_BITS << 1) & used, unit, unit << 1
+
+
+def grid_path_cells(origin, destination):
+    """Compute the cells crossed by the line between the centers of two cells.
+
+    The line is walked on the tile grid with integer arithmetic, moving
+    one cell up, down, left or right at a time, as ``geometry_to_cells``
+    does for lines. The path does not wrap around the antimeridian.
+
+    Parameters
+    ----------
+    origin : int
+    destination : int
+        Cell at the resolution of the origin.
+
+    Returns
+    -------
+    list
+        Cells from the origin to the destination, both included.
+
+    Raises
+    ------
+    ValueError
+        If the cells have different resolutions.
+    """
+    x0, y0, z = cell_to_tile(origin)
+    x1, y1, destination_z = cell_to_tile(destination)
+    if z != destination_z:
+        raise ValueError("Invalid resolution: cells should have the same resolution")
+
+    x_mask, y_mask, x_unit, y_unit = sibling_masks(z)
+    ax = abs(x1 - x0)
+    ay = abs(y1 - y0)
+    x_step = 1 if x1 > x0 else -1
+    y_step = 1 if y1 > y0 else -1
+
+    cell = origin
+    cells = [cell]
+    i = j = 0
+    while i < ax or j < ay:
+        # Move along x when the line crosses a column edge before a row edge,
+        # comparing the crossings (2i + 1) / 2ax and (2j + 1) / 2ay
+        if j == ay or (i < ax and (2 * i + 1) * ay < (2 * j + 1) * ax):
+            x = cell & x_mask
+            if x_step > 0:
+                x = ((x | y_mask) + x_unit) & x_mask
+            else:
+                x = (x - x_unit) & x_mask
+            cell = (cell & ~x_mask) | x
+            i += 1
+        else:
+            y = cell & y_mask
+            if y_step > 0:
+                y = ((y | x_mask) + y_unit) & y_mask
+            else:
+                y = (y - y_unit) & y_mask
+            cell = (cell & ~y_mask) | y
+            j += 1
+        cells.append(cell)
+
+    return cells
+
+
+def grid_paths_cells(origins, destinations):
+    """Compute the cells crossed by the lines between many pairs of cells.
+
+    Parameters
+    ----------
+    origins : iterable of int
+    destinations : iterable of int
+        Cell at the resolution of each origin.
+
+    Returns
+    -------
+    list of list
+        Cells of each path, from the origin to the destination.
+
+    Raises
+    ------
+    ValueError
+        If the cells of a pair have different resolutions or the numbers of
+        origins and destinations differ.
+    """
+    origins = to_list(origins)
+    destinations = to_list(destinations)
+    check_lengths(
+        "Invalid paths: should have as many origins as destinations",
+        origins,
+        destinations,
+    )
+    return [
+        grid_path_cells(origin, destination)
+        for origin, destination in zip(origins, destinations)
+    ]
+
+
 def cell_to_parent(cell, parent_resolution):
     """Compute the parent cell for a specific resolution.
 
@@ -472,6 +1142,97 @@ def cell_to_children(cell, children_resolution):
     return children
 
 
+def cell_to_children_range(cell, children_resolution):
+    """Compute the range of the children cells for a specific resolution.
+
+    The children of a cell are contiguous in the order of the indexes.
+
+    Parameters
+    ----------
+    cell : int
+    children_resolution : int
+        Resolution of the children, the cell resolution included.
+
+    Returns
+    -------
+    tuple (int, int)
+        Minimum and maximum children cells.
+
+    Raises
+    ------
+    ValueError
+        If the children resolution is not valid.
+    """
+    resolution = (cell >> 52) & 0x1F
+
+    if (
+        children_resolution < 0
+        or children_resolution > 26
+        or children_resolution < resolution
+    ):
+        raise ValueError("Invalid resolution")
+
+    resolution_diff = children_resolution - resolution
+    block_range = 1 << (resolution_diff << 1)
+    block_shift = 52 - (children_resolution << 1)
+
+    child_base = (cell & ~(0x1F << 52)) | (children_resolution << 52)
+    child_base = child_base & ~((block_range - 1) << block_shift)
+
+    return child_base, child_base | ((block_range - 1) << block_shift)
+
+
+def tile_to_cell_range(x, y, z, resolution):
+    """Compute the range of the cells of a tile at a specific resolution.
+
+    The cells of a tile are contiguous in the order of the indexes, so the
+    range can be used for a single index range scan.
+
+    Parameters
+    ----------
+    x : int
+    y : int
+    z : int
+    resolution : int
+        Resolution of the cells, the tile zoom included.
+
+    Returns
+    -------
+    tuple (int, int)
+        Minimum and maximum cells.
+
+    Raises
+    ------
+    ValueError
+        If the tile or the resolution are not valid.
+    """
+    if z < 0 or z > 26 or x < 0 or y < 0 or x >= (1 << z) or y >= (1 << z):
+        raise ValueError("Invalid tile")
+    return cell_to_children_range(tile_to_cell((x, y, z)), resolution)
+
+
+def tiles_to_cell_ranges(tiles, resolution):
+    """Compute the ranges of the cells of many tiles at a specific resolution.
+
+    Parameters
+    ----------
+    tiles : iterable of tuple (x, y, z)
+    resolution : int
+        Resolution of the cells.
+
+    Returns
+    -------
+    list of tuple (int, int)
+        Minimum and maximum cells of each tile.
+
+    Raises
+    ------
+    ValueError
+        If any tile or the resolution are not valid.
+    """
+    return [tile_to_cell_range(x, y, z, resolution) for x, y, z in to_list(tiles)]
+
+
 def geometry_to_cells(geometry, resolution):
     """Compute the cells that fill an input geometry.
 
@@ -500,6 +1261,130 @@ def geometry_to_cells(geometry, resolution):
     return [tile_to_cell(tile) for tile in tiles]
 
 
+def point_radius_to_cells(longitude, latitude, radius, resolution, compact=False):
+    """Compute the cells that intersect a circle around a point.
+
+    The rows of the circle bounding box are enumerated directly, and for
+    each row the columns are taken from the widest longitude extent of the
+    circle inside it, so the cells are those whose bounds intersect the
+    circle on the sphere.
+
+    Parameters
+    ----------
+    longitude : float
+        Longitude of the center in decimal degrees.
+    latitude : float
+        Latitude of the center in decimal degrees.
+    radius : float
+        Radius of the circle in meters.
+    resolution : int
+        The resolution of the cells.
+    compact : bool, optional
+        Replace the groups of four sibling cells by their parent, at every
+        resolution, by default False.
+
+    Returns
+    -------
+    list
+        Cells intersecting the circle, in ascending order.
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds or the radius is negative.
+    """
+    if resolution < 0 or resolution > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+    if radius < 0:
+        raise ValueError("Invalid negative radius")
+
+    z = resolution
+    z2 = 1 << z
+    distance = min(radius / EARTH_RADIUS, math.pi)
+    degrees = math.degrees(distance)
+
+    _, y_min, _ = point_to_tile_fraction(0, clip_latitude(latitude + degrees), z)
+    _, y_max, _ = point_to_tile_fraction(0, clip_latitude(latitude - degrees), z)
+
+    columns = {}
+    cells = []
+    for y in range(int(y_min), int(y_max) + 1):
+        # Points beyond the grid latitudes fall in the first and last rows
+        north = 90.0 if y == 0 else compute_latitude(y, z)
+        south = -90.0 if y == z2 - 1 else compute_latitude(y + 1, z)
+        extent = circle_longitude_extent(latitude, distance, south, north)
+        if extent is None:
+            continue
+
+        if extent >= math.pi:
+            xs = range(z2)
+        else:
+            x_start = int(
+                math.floor(z2 * ((longitude - math.degrees(extent)) / 360.0 + 0.5))
+            )
+            x_stop = int(
+                math.floor(z2 * ((longitude + math.degrees(extent)) / 360.0 + 0.5))
+            )
+            if x_stop - x_start + 1 >= z2:
+                xs = range(z2)
+            else:
+                xs = [x % z2 for x in range(x_start, x_stop + 1)]
+
+        row = tile_to_cell((0, y, z))
+        for x in xs:
+            column = columns.get(x)
+            if column is None:
+                column = columns[x] = tile_to_cell((x, 0, z))
+            cells.append(row | column)
+
+    cells.sort()
+    if compact:
+        return compact_cells(cells)
+    return cells
+
+
+def compact_cells(cells):
+    """Replace the groups of four sibling cells by their parent, recursively.
+
+    Parameters
+    ----------
+    cells : list
+        Distinct cells at the same resolution, in ascending order.
+
+    Returns
+    -------
+    list
+        Cells of mixed resolutions, in ascending order.
+    """
+    if not cells:
+        return []
+
+    compacted = []
+    level = cells
+    resolution = get_resolution(cells[0])
+    while level and resolution > 0:
+        resolution -= 1
+        fill = (resolution << 52) | (FOOTER >> (resolution << 1))
+        parents = []
+        start = 0
+        while start < len(level):
+            parent = (level[start] & RESOLUTION_MASK) | fill
+            stop = start + 1
+            while (
+                stop < len(level) and (level[stop] & RESOLUTION_MASK) | fill == parent
+            ):
+                stop += 1
+            if stop - start == 4:
+                parents.append(parent)
+            else:
+                compacted.extend(level[start:stop])
+            start = stop
+        level = parents
+    compacted.extend(level)
+
+    return sorted(compacted)
+
+
 def cell_area(cell):
     """Approximate area of a cell in square meters.
 
@@ -514,3 +1399,82 @@ def cell_area(cell):
     float
     """
     return tile_area(cell_to_tile(cell))
+
+
+def cell_areas(cells):
+    """Approximate areas of many cells in square meters.
+
+       The area only depends on the row of the cell, so it is read from
+       the per-row area cache.
+
+    Parameters
+    ----------
+    cells : iterable of int
+
+    Returns
+    -------
+    list
+        Area of each cell.
+    """
+    areas = []
+    for cell in to_list(cells):
+        _, y, z = cell_to_tile(cell)
+        areas.append(row_area(y, z))
+    return areas
+
+
+def cells_area(cells):
+    """Approximate area of a set of cells in square meters.
+
+       Cells can have mixed resolutions. They are counted by row, and the
+       area of each row is added once.
+
+    Parameters
+    ----------
+    cells : iterable of int
+
+    Returns
+    -------
+    float
+    """
+    rows = Counter(cell & ~X_BITS for cell in to_list(cells))
+
+    area = 0.0
+    for row, count in rows.items():
+        _, y, z = cell_to_tile(row)
+        area += row_area(y, z) * count
+    return area
+
+
+def geometry_area_covered(geometry, resolution):
+    """Approximate area of the cells that fill an input geometry.
+
+       The area is computed from the row spans of the cover, without
+       enumerating its cells.
+
+    Parameters
+    ----------
+    geometry : str
+        Input geometry as GeoJSON.
+    resolution : int
+        The resolution of the cells.
+
+    Returns
+    -------
+    float
+        Area in square meters.
+    """
+    spans = []
+    geometry = json.loads(geometry)
+
+    if geometry["type"] == "GeometryCollection":
+        for geom in geometry["geometries"]:
+            spans += get_tiles_spans(geom, resolution)
+    else:
+        spans = get_tiles_spans(geometry, resolution)
+
+    area = 0.0
+    for y, row in merge_spans(spans).items():
+        count = sum(stop - start for start, stop in row)
+        area += row_area(y, resolution) * count
+    return area
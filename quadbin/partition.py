@@ -0,0 +1,107 @@
+from bisect import bisect_left
+
+from .main import FOOTER, RESOLUTION_MASK, cell_to_children_range, get_resolution
+from .utils import check_lengths, to_list
+
+
+def partition_cells(cells, n, resolution, weights=None):
+    """Split the cells space into contiguous ranges of balanced weight.
+
+    The cells are grouped by their parents at a resolution, which are
+    contiguous in the order of the indexes, and the boundaries between the
+    ranges are placed between those groups. The ranges cover the whole
+    space of the cells resolution, and being ranges of a Z-order curve,
+    they are spatially compact.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Cells with the same resolution.
+    n : int
+        Number of ranges.
+    resolution : int
+        Resolution of the parents the boundaries are snapped to.
+    weights : iterable of float, optional
+        Weight of each cell. By default, the cells are counted.
+
+    Returns
+    -------
+    tuple (list, list)
+        Ranges as (min_cell, max_cell), in ascending order, and their
+        weights. There are fewer than n ranges only if there are fewer
+        than n groups.
+
+    Raises
+    ------
+    ValueError
+        If n is not positive, the cells have different resolutions, the
+        parents resolution is not valid, or the numbers of cells and weights
+        differ.
+    """
+    if n < 1:
+        raise ValueError("Invalid number of ranges")
+
+    cells = to_list(cells)
+    weights = [1] * len(cells) if weights is None else to_list(weights)
+    check_lengths("Invalid weights: should have one weight per cell", cells, weights)
+    pairs = sorted(zip(cells, weights))
+    if not pairs:
+        return [], []
+
+    resolutions = set(get_resolution(cell) for cell, _ in pairs)
+    if len(resolutions) > 1:
+        raise ValueError("Invalid resolution: cells should have the same resolution")
+    cells_resolution = resolutions.pop()
+    if resolution < 0 or resolution > cells_resolution:
+        raise ValueError("Invalid resolution")
+
+    # Total weight of each group of cells with the same parent
+    fill = (resolution << 52) | (FOOTER >> (resolution << 1))
+    parents = []
+    cumulative = []
+    total = 0
+    for cell, weight in pairs:
+        parent = (cell & RESOLUTION_MASK) | fill
+        total += weight
+        if parents and parents[-1] == parent:
+            cumulative[-1] = total
+        else:
+            parents.append(parent)
+            cumulative.append(total)
+
+    # Split after the group whose cumulative weight is closest to an even
+    # share of the remaining weight, leaving a group for each next range
+    n = min(n, len(parents))
+    splits = []
+    previous = -1
+    for k in range(1, n):
+        low = previous + 1
+        high = len(parents) - 1 - (n - k)
+        done = cumulative[previous] if previous >= 0 else 0
+        target = done + (total - done) / float(n - k + 1)
+        i = bisect_left(cumulative, target)
+        if i > 0 and (
+            i == len(cumulative) or target - cumulative[i - 1] <= cumulative[i] - target
+        ):
+            i -= 1
+        previous = min(max(i, low), high)
+        splits.append(previous)
+
+    # The ranges cover all the children of the root cell
+    root = (parents[0] & RESOLUTION_MASK & ~FOOTER) | FOOTER
+    start, last = cell_to_children_range(root, cells_resolution)
+    step = 1 << (52 - (cells_resolution << 1))
+
+    ranges = []
+    range_weights = []
+    previous_total = 0
+    for i in splits:
+        stop = cell_to_children_range(parents[i + 1], cells_resolution)[0]
+        ranges.append((start, stop - step))
+        range_weights.append(cumulative[i] - previous_total)
+        start = stop
+        previous_total = cumulative[i]
+    ranges.append((start, last))
+    range_weights.append(total - previous_total)
+
+    return ranges, range_weights
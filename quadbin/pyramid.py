@@ -0,0 +1,290 @@
+from __future__ import division
+
+from .main import FOOTER, RESOLUTION_MASK, get_resolution
+from .utils import check_lengths, to_list
+
+
+def build_pyramid(cells, values, min_resolution=0):
+    """Aggregate cell values at every coarser resolution.
+
+    The cells are sorted once. Since the children of a cell are contiguous
+    in the order of the indexes, each level is computed with a single
+    linear pass over the previous one.
+
+    Parameters
+    ----------
+    cells : iterable of int
+        Cells at the base resolution. Repeated cells are aggregated.
+    values : iterable of float
+        Value of each cell.
+    min_resolution : int, optional
+        Coarsest resolution of the pyramid, by default 0.
+
+    Returns
+    -------
+    dict
+        Levels by resolution, from the base resolution to the minimum
+        resolution. Each level is a dict with the lists of "cells" in
+        ascending order and their "sum", "count", "min", "max" and "mean".
+
+    Raises
+    ------
+    ValueError
+        If the cells have different resolutions, the minimum resolution is
+        not valid, or the numbers of cells and values differ.
+    """
+    cells = to_list(cells)
+    values = to_list(values)
+    check_lengths("Invalid values: should have one value per cell", cells, values)
+    pairs = sorted(zip(cells, values))
+    if not pairs:
+        return {}
+
+    resolutions = set(get_resolution(cell) for cell, _ in pairs)
+    if len(resolutions) > 1:
+        raise ValueError("Invalid resolution: cells should have the same resolution")
+    resolution = resolutions.pop()
+    if min_resolution < 0 or min_resolution > resolution:
+        raise ValueError("Invalid resolution")
+
+    level = aggregate_level(
+        {
+            "cells": [cell for cell, _ in pairs],
+            "sum": [value for _, value in pairs],
+            "count": [1] * len(pairs),
+            "min": [value for _, value in pairs],
+            "max": [value for _, value in pairs],
+        },
+        resolution,
+    )
+    levels = {resolution: level}
+    for parent_resolution in range(resolution - 1, min_resolution - 1, -1):
+        level = aggregate_level(level, parent_resolution)
+        levels[parent_resolution] = level
+
+    return levels
+
+
+def aggregate_level(level, resolution):
+    """Aggregate a sorted level by its parents at a resolution.
+
+    Parameters
+    ----------
+    level : dict
+        Lists of "cells" in ascending order and their "sum", "count", "min"
+        and "max".
+    resolution : int
+        Resolution of the parents.
+
+    Returns
+    -------
+    dict
+        Lists of parent "cells" in ascending order and their "sum", "count",
+        "min", "max" and "mean".
+    """
+    fill = (resolution << 52) | (FOOTER >> (resolution << 1))
+
+    cells = []
+    sums = []
+    counts = []
+    mins = []
+    maxs = []
+    for cell, total, count, low, high in zip(
+        level["cells"], level["sum"], level["count"], level["min"], level["max"]
+    ):
+        parent = (cell & RESOLUTION_MASK) | fill
+        if cells and cells[-1] == parent:
+            sums[-1] += total
+            counts[-1] += count
+            if low < mins[-1]:
+                mins[-1] = low
+            if high > maxs[-1]:
+                maxs[-1] = high
+        else:
+            cells.append(parent)
+            sums.append(total)
+            counts.append(count)
+            mins.append(low)
+            maxs.append(high)
+
+    return {
+        "cells": cells,
+        "sum": sums,
+        "count": counts,
+        "min": mins,
+        "max": maxs,
+        "mean": [total / count for total, count in zip(sums, counts)],
+    }
+
+
+class PyramidAccumulator(object):
+    """Mutable pyramid of sums and counts updated with batches of values.
+
+    Each batch is first reduced by cell and then by parent at every level,
+    so an update costs time proportional to the batch, not to the data
+    already accumulated. The sorted cells of each level are kept between
+    snapshots, and only the cells added since the previous one are sorted.
+
+    Parameters
+    ----------
+    resolution : int
+        Base resolution of the cells added.
+    min_resolution : int, optional
+        Coarsest resolution of the pyramid, by default 0.
+
+    Raises
+    ------
+    ValueError
+        If the resolutions are not valid.
+    """
+
+    def __init__(self, resolution, min_resolution=0):
+        if resolution < 0 or resolution > 26:
+            raise ValueError("Invalid resolution: should be between 0 and 26")
+        if min_resolution < 0 or min_resolution > resolution:
+            raise ValueError("Invalid resolution")
+
+        self.resolution = resolution
+        self.min_resolution = min_resolution
+        self.sums = dict((r, {}) for r in range(min_resolution, resolution + 1))
+        self.counts = dict((r, {}) for r in range(min_resolution, resolution + 1))
+        # Sorted cells of each level, and the cells added since the last
+        # snapshot of the level
+        self.cells = dict((r, []) for r in range(min_resolution, resolution + 1))
+        self.new_cells = dict((r, []) for r in range(min_resolution, resolution + 1))
+
+    def add(self, cells, values=None):
+        """Add a batch of values to the pyramid.
+
+        Parameters
+        ----------
+        cells : iterable of int
+            Cells at the base resolution.
+        values : iterable of float, optional
+            Value of each cell. By default, each cell adds 1.
+
+        Raises
+        ------
+        ValueError
+            If any cell is not at the base resolution or the numbers of cells
+            and values differ. The pyramid is left unchanged.
+        """
+        cells = to_list(cells)
+        values = [1] * len(cells) if values is None else to_list(values)
+        check_lengths("Invalid values: should have one value per cell", cells, values)
+
+        batch_sums = {}
+        batch_counts = {}
+        for cell, value in zip(cells, values):
+            batch_sums[cell] = batch_sums.get(cell, 0) + value
+            batch_counts[cell] = batch_counts.get(cell, 0) + 1
+
+        for cell in batch_sums:
+            if get_resolution(cell) != self.resolution:
+                raise ValueError(
+                    "Invalid resolution: cells should be at resolution {0}".format(
+                        self.resolution
+                    )
+                )
+
+        for resolution in range(self.resolution, self.min_resolution - 1, -1):
+            if resolution < self.resolution:
+                batch_sums, batch_counts = aggregate_batch(
+                    batch_sums, batch_counts, resolution
+                )
+            sums = self.sums[resolution]
+            counts = self.counts[resolution]
+            new_cells = self.new_cells[resolution]
+            for cell, total in batch_sums.items():
+                if cell not in sums:
+                    new_cells.append(cell)
+                sums[cell] = sums.get(cell, 0) + total
+                counts[cell] = counts.get(cell, 0) + batch_counts[cell]
+
+    def get(self, cell):
+        """Read the accumulated sum and count of a cell.
+
+        Parameters
+        ----------
+        cell : int
+            Cell at any resolution of the pyramid.
+
+        Returns
+        -------
+        tuple (float, int)
+            Sum and count, zero if the cell has no values.
+
+        Raises
+        ------
+        ValueError
+            If the cell resolution is not in the pyramid.
+        """
+        resolution = get_resolution(cell)
+        if resolution not in self.sums:
+            raise ValueError("Invalid resolution")
+        return (
+            self.sums[resolution].get(cell, 0),
+            self.counts[resolution].get(cell, 0),
+        )
+
+    def snapshot(self, resolution):
+        """Read a level of the pyramid.
+
+        Parameters
+        ----------
+        resolution : int
+
+        Returns
+        -------
+        dict
+            Lists of "cells" in ascending order and their "sum", "count"
+            and "mean".
+
+        Raises
+        ------
+        ValueError
+            If the resolution is not in the pyramid.
+        """
+        if resolution not in self.sums:
+            raise ValueError("Invalid resolution")
+        sums = self.sums[resolution]
+        counts = self.counts[resolution]
+
+        # Only the new cells are sorted, the merge of both sorted runs is
+        # linear
+        cells = self.cells[resolution]
+        new_cells = self.new_cells[resolution]
+        if new_cells:
+            new_cells.sort()
+            cells.extend(new_cells)
+            cells.sort()
+            del new_cells[:]
+
+        level = {
+            "cells": list(cells),
+            "sum": [sums[cell] for cell in cells],
+            "count": [counts[cell] for cell in cells],
+        }
+        level["mean"] = [
+            total / count for total, count in zip(level["sum"], level["count"])
+        ]
+        return level
+
+
+def aggregate_batch(sums, counts, resolution):
+    """Aggregate the sums and counts of cells by their parents at a resolution.
+
+    Returns
+    -------
+    tuple (dict, dict)
+    """
+    fill = (resolution << 52) | (FOOTER >> (resolution << 1))
+
+    parent_sums = {}
+    parent_counts = {}
+    for cell, total in sums.items():
+        parent = (cell & RESOLUTION_MASK) | fill
+        parent_sums[parent] = parent_sums.get(parent, 0) + total
+        parent_counts[parent] = parent_counts.get(parent, 0) + counts[cell]
+
+    return parent_sums, parent_counts
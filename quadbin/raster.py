@@ -0,0 +1,182 @@
+from __future__ import division
+
+from .main import cell_to_tile, tile_to_cell
+from .utils import AGGREGATORS, check_lengths, to_list
+
+
+def raster_to_cells(raster, z, x0=0, y0=0, nodata=None):
+    """Convert a raster aligned to the Web Mercator tile grid into cells.
+
+    Each pixel of the raster is a tile at resolution z. The interleaving of
+    the tile coordinates is separable, so the bits of each column and each
+    row are only interleaved once, and the cell of a pixel is the union of
+    both.
+
+    Parameters
+    ----------
+    raster : 2D array-like
+        Rows of values, from north to south, with the columns from west to
+        east.
+    z : int
+        Resolution of the pixels.
+    x0 : int, optional
+        Column of the tile of the first pixel, by default 0.
+    y0 : int, optional
+        Row of the tile of the first pixel, by default 0.
+    nodata : optional
+        Value of the pixels that are skipped. NaN skips NaN values.
+
+    Returns
+    -------
+    tuple (list, list)
+        Cells and values of the pixels, row by row.
+
+    Raises
+    ------
+    ValueError
+        If the resolution is out of bounds or the raster exceeds the grid.
+    """
+    if z < 0 or z > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+
+    rows = to_list(raster)
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    if (
+        x0 < 0
+        or y0 < 0
+        or x0 + width > (1 << z)
+        or y0 + height > (1 << z)
+        or any(len(row) != width for row in rows)
+    ):
+        raise ValueError("Invalid raster: should be a window of the tile grid")
+
+    columns = [tile_to_cell((x0 + j, 0, z)) for j in range(width)]
+    skip_nan = nodata is not None and nodata != nodata
+
+    cells = []
+    values = []
+    for i, row in enumerate(rows):
+        row_cell = tile_to_cell((0, y0 + i, z))
+        if nodata is None:
+            cells.extend([row_cell | column for column in columns])
+            values.extend(row)
+        else:
+            for column, value in zip(columns, row):
+                if value == nodata or (skip_nan and value != value):
+                    continue
+                cells.append(row_cell | column)
+                values.append(value)
+
+    return cells, values
+
+
+def cells_to_raster(
+    cells, values, z, x0, y0, width, height, aggregator="sum", nodata=None
+):
+    """Fill a raster window of the Web Mercator tile grid with cell values.
+
+    Each pixel of the raster is a tile at resolution z. Coarser cells fill
+    all the pixels they cover, and the values of finer cells, or of several
+    cells on the same pixel, are reduced with the aggregator.
+
+    Parameters
+    ----------
+    cells : iterable of int
+    values : iterable of float
+        Value of each cell.
+    z : int
+        Resolution of the pixels.
+    x0 : int
+        Column of the tile of the first pixel.
+    y0 : int
+        Row of the tile of the first pixel.
+    width : int
+        Number of columns.
+    height : int
+        Number of rows.
+    aggregator : str, optional
+        Reduction of the values of a pixel: "sum" (default), "count",
+        "min", "max" or "mean".
+    nodata : optional
+        Value of the pixels without cells, by default None.
+
+    Returns
+    -------
+    list
+        Rows of values, from north to south, with the columns from west to
+        east.
+
+    Raises
+    ------
+    ValueError
+        If the resolution, the window or the aggregator are not valid, or
+        the numbers of cells and values differ.
+    """
+    if z < 0 or z > 26:
+        raise ValueError("Invalid resolution: should be between 0 and 26")
+    if (
+        x0 < 0
+        or y0 < 0
+        or width < 0
+        or height < 0
+        or x0 + width > (1 << z)
+        or y0 + height > (1 << z)
+    ):
+        raise ValueError("Invalid raster: should be a window of the tile grid")
+    if aggregator not in AGGREGATORS:
+        raise ValueError("Wrong aggregator argument passed to cells_to_raster")
+
+    cells = to_list(cells)
+    values = to_list(values)
+    check_lengths("Invalid values: should have one value per cell", cells, values)
+
+    totals = {}
+    counts = {}
+    for cell, value in zip(cells, values):
+        x, y, cell_z = cell_to_tile(cell)
+        if cell_z >= z:
+            shift = cell_z - z
+            pixels = pixels_window(x >> shift, y >> shift, 1, x0, y0, width, height)
+        else:
+            shift = z - cell_z
+            pixels = pixels_window(
+                x << shift, y << shift, 1 << shift, x0, y0, width, height
+            )
+
+        for pixel in pixels:
+            if pixel not in totals:
+                totals[pixel] = value
+                counts[pixel] = 1
+                continue
+            counts[pixel] += 1
+            if aggregator == "sum" or aggregator == "mean":
+                totals[pixel] += value
+            elif aggregator == "min":
+                totals[pixel] = min(totals[pixel], value)
+            elif aggregator == "max":
+                totals[pixel] = max(totals[pixel], value)
+
+    if aggregator == "count":
+        totals = counts
+    elif aggregator == "mean":
+        totals = dict((pixel, totals[pixel] / counts[pixel]) for pixel in totals)
+
+    return [
+        [totals.get(i * width + j, nodata) for j in range(width)] for i in range(height)
+    ]
+
+
+def pixels_window(x, y, size, x0, y0, width, height):
+    """Return the pixels of a square of tiles inside a raster window.
+
+    Returns
+    -------
+    list
+        Positions of the pixels, row by row.
+    """
+    xmin = max(x, x0) - x0
+    xmax = min(x + size, x0 + width) - x0
+    ymin = max(y, y0) - y0
+    ymax = min(y + size, y0 + height) - y0
+    return [i * width + j for i in range(ymin, ymax) for j in range(xmin, xmax)]
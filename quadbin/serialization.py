@@ -0,0 +1,283 @@
+import struct
+from bisect import bisect_right
+
+from .cellset import CellSet
+from .main import FOOTER, get_resolution
+
+MAGIC = b"QBCS"
+VERSION = 1
+MIXED_RESOLUTION = 0xFF
+
+# magic, version, resolution, prefix, count, block size, number of blocks
+HEADER_FORMAT = "<4sBBHQII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# first key and data offset of each block
+BLOCK_FORMAT = "<QQ"
+BLOCK_SIZE = struct.calcsize(BLOCK_FORMAT)
+
+
+def dump_cells(cells, fp, block_size=1024):
+    """Write a set of cells in a compact binary format.
+
+    The cells are sorted and stored as varint-encoded deltas. When all the
+    cells have the same header, mode and resolution, those are stored once
+    and the deltas are computed between the Morton codes of the cells. The
+    deltas are split in blocks of ``block_size`` cells, and
+    an index with the first cell of each block allows seeking.
+
+    Parameters
+    ----------
+    cells : CellSet or iterable of int
+    fp : file-like
+        Binary stream with a ``write`` method.
+    block_size : int, optional
+        Number of cells per block, by default 1024.
+
+    Returns
+    -------
+    int
+        Number of cells written.
+
+    Raises
+    ------
+    ValueError
+        If the block size is not valid.
+    """
+    if block_size < 1:
+        raise ValueError("Invalid block size")
+    if not isinstance(cells, CellSet):
+        cells = CellSet(cells)
+
+    prefixes = set(cell >> 52 for cell in cells)
+    resolution = get_resolution(cells[0]) if cells else 0
+    unused = (1 << key_shift(resolution)) - 1
+    if len(prefixes) == 1 and all(cell & unused == unused for cell in cells):
+        prefix = prefixes.pop()
+        keys = [(cell & FOOTER) >> key_shift(resolution) for cell in cells]
+    else:
+        resolution = MIXED_RESOLUTION
+        prefix = 0
+        keys = list(cells)
+
+    index = []
+    data = bytearray()
+    for start in range(0, len(keys), block_size):
+        stop = start + block_size
+        index.append(struct.pack(BLOCK_FORMAT, keys[start], len(data)))
+        block = keys[start:stop]
+        previous = block[0]
+        for key in block[1:]:
+            encode_varint(key - previous, data)
+            previous = key
+
+    fp.write(
+        struct.pack(
+            HEADER_FORMAT,
+            MAGIC,
+            VERSION,
+            resolution,
+            prefix,
+            len(keys),
+            block_size,
+            len(index),
+        )
+    )
+    fp.write(b"".join(index))
+    fp.write(bytes(data))
+
+    return len(keys)
+
+
+def load_cells(fp):
+    """Read a set of cells written by ``dump_cells``.
+
+    Parameters
+    ----------
+    fp : file-like
+        Binary stream with a ``read`` method.
+
+    Returns
+    -------
+    CellSet
+
+    Raises
+    ------
+    ValueError
+        If the stream is not a valid cells file.
+    """
+    reader = CellSetReader(fp)
+    cells = []
+    for block in range(len(reader.keys)):
+        cells += reader.read_block(block)
+    return CellSet.from_sorted(cells)
+
+
+class CellSetReader(object):
+    """Seekable reader of a cells file written by ``dump_cells``.
+
+    Only the header and the block index are read when opening. Lookups
+    find the block with a binary search on the index and only decode it.
+
+    Parameters
+    ----------
+    fp : file-like
+        Binary stream with ``read`` and ``seek`` methods.
+
+    Raises
+    ------
+    ValueError
+        If the stream is not a valid cells file.
+    """
+
+    def __init__(self, fp):
+        header = fp.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE:
+            raise ValueError("Invalid cells file: truncated header")
+        (
+            magic,
+            version,
+            self.resolution,
+            self.prefix,
+            self.count,
+            self.block_size,
+            blocks,
+        ) = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Invalid cells file: unknown format")
+
+        index = fp.read(BLOCK_SIZE * blocks)
+        if len(index) != BLOCK_SIZE * blocks:
+            raise ValueError("Invalid cells file: truncated index")
+        self.keys = []
+        self.offsets = []
+        for block in range(blocks):
+            key, offset = struct.unpack_from(BLOCK_FORMAT, index, block * BLOCK_SIZE)
+            self.keys.append(key)
+            self.offsets.append(offset)
+
+        self.fp = fp
+        self.data_start = fp.tell()
+
+    def __len__(self):
+        """Return the number of cells."""
+        return self.count
+
+    def __contains__(self, cell):
+        """Return True if the cell is in the file."""
+        key = self.cell_to_key(cell)
+        if key is None:
+            return False
+        block = bisect_right(self.keys, key) - 1
+        if block < 0:
+            return False
+        return cell in self.read_block(block)
+
+    def cell_to_key(self, cell):
+        """Return the key of a cell in the file, or None if it can't be stored.
+
+        Returns
+        -------
+        int
+        """
+        if self.resolution == MIXED_RESOLUTION:
+            return cell
+        if cell >> 52 != self.prefix:
+            return None
+        return (cell & FOOTER) >> key_shift(self.resolution)
+
+    def key_to_cell(self, key):
+        """Return the cell of a key in the file.
+
+        Returns
+        -------
+        int
+        """
+        if self.resolution == MIXED_RESOLUTION:
+            return key
+        shift = key_shift(self.resolution)
+        return (self.prefix << 52) | (key << shift) | ((1 << shift) - 1)
+
+    def read_block(self, block):
+        """Decode the cells of a block.
+
+        Parameters
+        ----------
+        block : int
+            Position of the block.
+
+        Returns
+        -------
+        list
+            Cells of the block in ascending order.
+        """
+        start = self.offsets[block]
+        if block + 1 < len(self.offsets):
+            size = self.offsets[block + 1] - start
+        else:
+            size = -1
+        self.fp.seek(self.data_start + start)
+        data = bytearray(self.fp.read(size))
+
+        length = min(self.block_size, self.count - block * self.block_size)
+        keys = [self.keys[block]]
+        position = 0
+        for _ in range(length - 1):
+            delta, position = decode_varint(data, position)
+            keys.append(keys[-1] + delta)
+
+        return [self.key_to_cell(key) for key in keys]
+
+
+def key_shift(resolution):
+    """Return the number of unused bits of a resolution.
+
+    Returns
+    -------
+    int
+    """
+    return 52 - (resolution << 1)
+
+
+def encode_varint(value, data):
+    """Append an unsigned integer as a LEB128 varint.
+
+    Parameters
+    ----------
+    value : int
+    data : bytearray
+    """
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def decode_varint(data, position):
+    """Read a LEB128 varint.
+
+    Parameters
+    ----------
+    data : bytearray
+    position : int
+
+    Returns
+    -------
+    tuple (int, int)
+        The value and the position after it.
+
+    Raises
+    ------
+    ValueError
+        If the data is truncated.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Invalid cells file: truncated data")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
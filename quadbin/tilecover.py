@@ -28,7 +28,90 @@ def get_tiles(geometry, resolution):
     Exception
         If the geometry type is not supported.
     """
-    tiles_hashes = []
+    return tiles_hashes_to_tiles(get_tiles_hashes(geometry, resolution))
+
+
+def get_tiles_spans(geometry, resolution):
+    """Compute the row spans of the tiles that fill an input geometry.
+
+    The interior of the polygons is returned as spans, without
+    enumerating its tiles.
+
+    Parameters
+    ----------
+    geometry : dict
+        Input geometry as GeoJSON.
+    resolution : int
+        The resolution of the cells.
+
+    Returns
+    -------
+    list
+        Spans (y, x_start, x_stop) of the tiles, x_stop excluded.
+
+    Raises
+    ------
+    Exception
+        If the geometry type is not supported.
+    """
+    geom_type = geometry["type"]
+    geom_coordinates = geometry["coordinates"]
+
+    if geom_type == "Polygon" or geom_type == "MultiPolygon":
+        polygons = [geom_coordinates] if geom_type == "Polygon" else geom_coordinates
+        tiles_hashes = []
+        spans = []
+        for polygon in polygons:
+            polygon_tiles_hashes, polygon_spans = polygon_cover_spans(
+                polygon, resolution
+            )
+            tiles_hashes += polygon_tiles_hashes
+            spans += polygon_spans
+    else:
+        tiles_hashes = get_tiles_hashes(geometry, resolution)
+        spans = []
+
+    for x, y, _ in tiles_hashes_to_tiles(tiles_hashes):
+        spans.append((y, x, x + 1))
+
+    return spans
+
+
+def merge_spans(spans):
+    """Merge overlapping spans by row.
+
+    Parameters
+    ----------
+    spans : list
+        Spans (y, x_start, x_stop), x_stop excluded.
+
+    Returns
+    -------
+    dict
+        Disjoint sorted [x_start, x_stop] spans by row y.
+    """
+    rows = {}
+    for y, start, stop in sorted(spans):
+        row = rows.setdefault(y, [])
+        if row and start <= row[-1][1]:
+            row[-1][1] = max(row[-1][1], stop)
+        elif start < stop:
+            row.append([start, stop])
+    return rows
+
+
+def get_tiles_hashes(geometry, resolution):
+    """Compute the tiles hashes that fill an input geometry.
+
+    Returns
+    -------
+    list
+
+    Raises
+    ------
+    Exception
+        If the geometry type is not supported.
+    """
     geom_type = geometry["type"]
     geom_coordinates = geometry["coordinates"]
 
@@ -44,9 +127,7 @@ def get_tiles(geometry, resolution):
     if geom_type not in get_tiles_hashes_function:
         raise Exception("Geometry type not implemented")
 
-    tiles_hashes = get_tiles_hashes_function[geom_type](geom_coordinates, resolution)
-
-    return tiles_hashes_to_tiles(tiles_hashes)
+    return get_tiles_hashes_function[geom_type](geom_coordinates, resolution)
 
 
 def get_point_tiles_hashes(coordinates, resolution):
@@ -200,8 +281,28 @@ def polygon_cover(geom, zoom):
     -------
     list
     """
+    tiles_hashes, spans = polygon_cover_spans(geom, zoom)
+
+    for y, start, stop in spans:
+        #  fill tiles between pairs of intersections
+        for x in range(start, stop):
+            tiles_hashes.append(to_tile_hash(x, y, zoom))
+
+    return tiles_hashes
+
+
+def polygon_cover_spans(geom, zoom):
+    """Return the boundary tiles hashes and the interior spans of a polygon.
+
+    Returns
+    -------
+    tuple (list, list)
+        Tiles hashes of the rings, and spans (y, x_start, x_stop) between
+        pairs of intersections.
+    """
     tiles_hashes = []
     intersections = []
+    spans = []
 
     for i in range(len(geom)):
         ring = []
@@ -226,12 +327,13 @@ def polygon_cover(geom, zoom):
     intersections.sort(key=lambda tile: (tile[1], tile[0]))
 
     for i in range(0, len(intersections), 2):
-        #  fill tiles between pairs of intersections
         y = intersections[i][1]
-        for x in range(int(intersections[i][0] + 1), int(intersections[i + 1][0])):
-            tiles_hashes.append(to_tile_hash(x, y, zoom))
+        start = int(intersections[i][0] + 1)
+        stop = int(intersections[i + 1][0])
+        if start < stop:
+            spans.append((int(y), start, stop))
 
-    return tiles_hashes
+    return tiles_hashes, spans
 
 
 def to_tile_hash(x, y, z):
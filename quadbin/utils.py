@@ -1,4 +1,5 @@
 import math
+from collections import OrderedDict
 
 MAX_LONGITUDE = 180.0
 MIN_LONGITUDE = -MAX_LONGITUDE
@@ -12,6 +13,24 @@ DOWN = 3
 
 DIRECTIONS = {"up": UP, "right": RIGHT, "left": LEFT, "down": DOWN}
 
+AGGREGATORS = ("sum", "count", "min", "max", "mean")
+
+# Radius of the WGS84 authalic sphere in meters
+EARTH_RADIUS = 6371007.180918475
+
+# Half the width of the Web Mercator (EPSG:3857) plane in meters
+MERCATOR_EXTENT = 20037508.342789244
+
+# Per-row areas are stored in full tables up to this resolution,
+# and in a bounded FIFO cache for the higher ones
+ROW_TABLE_MAX_RESOLUTION = 13
+ROW_CACHE_SIZE = 1 << 16
+
+AREA_TABLES = {}
+AREA_CACHE = OrderedDict()
+
+ARROW_FORMATS = {"int64": "q", "uint64": "Q"}
+
 
 def clip_number(num, lower, upper):
     """Limit input number by lower and upper limits.
@@ -92,6 +111,62 @@ def tile_to_latitude(tile, offset):
     return 360 * (math.atan(expy) / math.pi - 0.25)
 
 
+def cached_row_value(tables, cache, compute, y, z):
+    """Return a value that only depends on the row, computing it once.
+
+    Parameters
+    ----------
+    tables : dict
+        Full tables by resolution.
+    cache : OrderedDict
+        Bounded cache for the resolutions without full table.
+    compute : function
+        Function of (y, z) computing the value.
+    y : int
+    z : int
+
+    Returns
+    -------
+    float
+    """
+    if y < 0 or y > (1 << z):
+        return compute(y, z)
+
+    if z <= ROW_TABLE_MAX_RESOLUTION:
+        table = tables.get(z)
+        if table is None:
+            table = tables.setdefault(z, [None] * ((1 << z) + 1))
+        value = table[y]
+        if value is None:
+            value = table[y] = compute(y, z)
+        return value
+
+    key = (y << 5) | z
+    value = cache.get(key)
+    if value is None:
+        value = compute(y, z)
+        while len(cache) >= ROW_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[key] = value
+    return value
+
+
+def compute_latitude(y, z):
+    """Compute the latitude of a fractional row.
+
+    Parameters
+    ----------
+    y : float
+    z : int
+
+    Returns
+    -------
+    latitude : float
+    """
+    expy = math.exp(-(2.0 * y / (1 << z) - 1) * math.pi)
+    return 360 * (math.atan(expy) / math.pi - 0.25)
+
+
 def point_to_tile(longitude, latitude, resolution):
     """Compute the tile for a longitude and latitude in a specific resolution.
 
@@ -146,6 +221,78 @@ def point_to_tile_fraction(longitude, latitude, resolution):
     return (x, y, z)
 
 
+def mercator_to_tile(x, y, resolution):
+    """Compute the tile for Web Mercator coordinates in a specific resolution.
+
+    The projected coordinates are linear in the tile grid, so no
+    trigonometric function is needed.
+
+    Parameters
+    ----------
+    x : float
+        Easting in meters (EPSG:3857).
+    y : float
+        Northing in meters (EPSG:3857).
+    resolution : int
+        The resolution of the tile.
+
+    Returns
+    -------
+    tile: tuple (x, y, z)
+    """
+    z2 = 1 << resolution
+    x = clip_number(x, -MERCATOR_EXTENT, MERCATOR_EXTENT)
+    tile_x = int(math.floor(z2 * (0.5 + x / (2 * MERCATOR_EXTENT)))) % z2
+    tile_y = clip_number(
+        int(math.floor(z2 * (0.5 - y / (2 * MERCATOR_EXTENT)))), 0, z2 - 1
+    )
+    return (tile_x, tile_y, resolution)
+
+
+def circle_longitude_extent(latitude, distance, south, north):
+    """Compute the longitude half-width of a circle inside a latitude band.
+
+    Parameters
+    ----------
+    latitude : float
+        Latitude of the center of the circle in decimal degrees.
+    distance : float
+        Angular radius of the circle in radians.
+    south : float
+        South edge of the band in decimal degrees.
+    north : float
+        North edge of the band in decimal degrees.
+
+    Returns
+    -------
+    float
+        Maximum longitude difference with the center in radians, pi if the
+        circle covers the whole band width, or None if it misses the band.
+    """
+    south = max(south, latitude - math.degrees(distance))
+    north = min(north, latitude + math.degrees(distance))
+    if south > north:
+        return None
+
+    # The half-width is largest at this latitude, or at the pole when the
+    # circle contains it
+    sin_center = math.sin(math.radians(latitude))
+    cos_distance = math.cos(distance)
+    if cos_distance > abs(sin_center):
+        widest = math.degrees(math.asin(sin_center / cos_distance))
+    else:
+        widest = 90.0 if latitude >= 0 else -90.0
+    phi = math.radians(clip_number(widest, south, north))
+
+    denominator = math.cos(math.radians(latitude)) * math.cos(phi)
+    if denominator < 1e-15:
+        return math.pi
+    c = (cos_distance - sin_center * math.sin(phi)) / denominator
+    if c <= -1:
+        return math.pi
+    return math.acos(min(c, 1.0))
+
+
 def tile_sibling(tile, direction):
     """Compute the sibling tile in a specific direction.
 
@@ -244,6 +391,46 @@ def distinct(array):
     return list(set(array))
 
 
+def check_lengths(message, *sequences):
+    """Check that sequences have the same length.
+
+    Parameters
+    ----------
+    message : str
+        Message of the error.
+    *sequences : sequence
+
+    Raises
+    ------
+    ValueError
+        If the lengths differ.
+    """
+    if len(set(len(sequence) for sequence in sequences)) > 1:
+        raise ValueError(message)
+
+
+def to_list(values):
+    """Return the values of an array-like as a list of Python scalars.
+
+    Arrow 64-bit integer arrays without nulls are read from their data
+    buffer, without creating intermediate Arrow scalars.
+    """
+    chunks = getattr(values, "chunks", None)
+    if chunks is not None:
+        return [value for chunk in chunks for value in to_list(chunk)]
+    if hasattr(values, "to_pylist"):
+        type_name = str(getattr(values, "type", ""))
+        if values.null_count == 0 and type_name in ARROW_FORMATS:
+            start = values.offset
+            stop = start + len(values)
+            data = memoryview(values.buffers()[1]).cast(ARROW_FORMATS[type_name])
+            return data[start:stop].tolist()
+        return values.to_pylist()
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
 def tile_scalefactor(tile):
     """Inverse of the scale factor at the tile center.
 
@@ -255,17 +442,7 @@ def tile_scalefactor(tile):
     -------
     float
     """
-    _, y, z = tile
-    y_offset = 0.5
-    return math.cos(
-        2
-        * math.pi
-        * (
-            math.atan(math.exp(-(2 * (y + y_offset) / (1 << z) - 1) * math.pi))
-            / math.pi
-            - 0.25
-        )
-    )
+    return math.cos(math.radians(tile_to_latitude(tile, 0.5)))
 
 
 REF_AREA = 508164597540055.75
@@ -298,14 +475,44 @@ def tile_area(tile):
     -------
     float
     """
-    x, y, z = tile
+    _, y, z = tile
+    return row_area(y, z)
+
+
+def row_area(y, z):
+    """Approximate area of the tiles of a row in square meters, using the cache.
+
+    Parameters
+    ----------
+    y : int
+    z : int
+
+    Returns
+    -------
+    float
+    """
+    return cached_row_value(AREA_TABLES, AREA_CACHE, compute_row_area, y, z)
+
+
+def compute_row_area(y, z):
+    """Approximate area of the tiles of a row in square meters.
+
+    Parameters
+    ----------
+    y : int
+    z : int
+
+    Returns
+    -------
+    float
+    """
     area_factor = AREA_FACTORS[min(len(AREA_FACTORS) - 1, z)]
     area = area_factor * REF_AREA / (1 << (z << 1))
     center_y = 0 if z == 0 else (1 << (z - 1))
     if y < center_y - 1 or y > center_y:
 
         def z_factor(y):
-            return math.pow(tile_scalefactor((x, y, z)), 2)
+            return math.pow(tile_scalefactor((0, y, z)), 2)
 
         area *= z_factor(y) / z_factor(center_y)
 
@@ -0,0 +1,39 @@
+import pickle
+
+import quadbin
+
+
+CELLS = quadbin.cell_to_children(5209574053332910079, 6)
+
+
+def test_cell_set():
+    cells = quadbin.CellSet(reversed(CELLS + CELLS[:3]))
+    assert len(cells) == 16
+    assert list(cells) == sorted(CELLS)
+    assert cells[0] == min(CELLS)
+    assert all(cell in cells for cell in CELLS)
+    assert 5209574053332910079 not in cells
+    assert 0 not in cells
+    assert (1 << 64) - 1 not in cells
+    assert len(quadbin.CellSet()) == 0
+    assert 5209574053332910079 not in quadbin.CellSet()
+
+
+def test_cell_set_operations():
+    a = quadbin.CellSet(CELLS[:10])
+    b = quadbin.CellSet(CELLS[5:] + [5209574053332910079])
+    assert a | b == quadbin.CellSet(CELLS + [5209574053332910079])
+    assert a & b == quadbin.CellSet(CELLS[5:10])
+    assert a - b == quadbin.CellSet(CELLS[:5])
+    assert b - a == quadbin.CellSet(CELLS[10:] + [5209574053332910079])
+    assert a | quadbin.CellSet() == a
+    assert a & quadbin.CellSet() == quadbin.CellSet()
+    assert a != b
+
+
+def test_cell_set_pickle():
+    cells = quadbin.CellSet(CELLS)
+    assert pickle.loads(pickle.dumps(cells)) == cells
+    assert repr(quadbin.CellSet([5209574053332910079])) == (
+        "CellSet([5209574053332910079])"
+    )
@@ -0,0 +1,108 @@
+import json
+import random
+
+import quadbin
+
+
+def ring_area(ring):
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]))
+
+
+def covers(geometry, point):
+    inside = False
+    for polygon in geometry["coordinates"]:
+        for ring in polygon:
+            for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]):
+                if (y0 > point[1]) != (y1 > point[1]) and point[0] < x0:
+                    inside = not inside
+    return inside
+
+
+def cells_geometry(tiles):
+    return json.loads(
+        quadbin.cells_to_geometry([quadbin.tile_to_cell(tile) for tile in tiles])
+    )
+
+
+def test_cells_to_geometry_single_cell():
+    cell = quadbin.tile_to_cell((3, 3, 3))
+    geometry = json.loads(quadbin.cells_to_geometry([cell]))
+    assert geometry["type"] == "MultiPolygon"
+    assert geometry["coordinates"] == [[quadbin.cell_to_boundary(cell)]]
+
+
+def test_cells_to_geometry_block():
+    parent = quadbin.tile_to_cell((1, 1, 2))
+    children = quadbin.cell_to_children(parent, 4)
+    geometry = json.loads(quadbin.cells_to_geometry(children))
+    assert geometry["coordinates"] == [[quadbin.cell_to_boundary(parent)]]
+
+    # The same outline from mixed resolutions, with contained cells
+    cells = [quadbin.cell_to_children(parent, 3)[0]] + children[4:] + [children[0]]
+    assert json.loads(quadbin.cells_to_geometry(cells)) == geometry
+
+
+def test_cells_to_geometry_hole():
+    tiles = [(x, y, 4) for x in range(4, 8) for y in range(4, 8)]
+    tiles.remove((5, 5, 4))
+    tiles.append((10, 10, 4))
+    geometry = cells_geometry(tiles)
+
+    assert len(geometry["coordinates"]) == 2
+    shell, hole = [p for p in geometry["coordinates"] if len(p) == 2][0]
+    assert len(shell) == 5
+    assert hole == quadbin.cell_to_boundary(quadbin.tile_to_cell((5, 5, 4)))[::-1]
+    # Exterior rings are counterclockwise and holes clockwise
+    assert ring_area(shell) > 0
+    assert ring_area(hole) < 0
+
+
+def test_cells_to_geometry_touching_corners():
+    geometry = cells_geometry([(0, 0, 2), (1, 1, 2)])
+    assert sorted(geometry["coordinates"]) == sorted(
+        [
+            [quadbin.cell_to_boundary(quadbin.tile_to_cell((0, 0, 2)))],
+            [quadbin.cell_to_boundary(quadbin.tile_to_cell((1, 1, 2)))],
+        ]
+    )
+
+
+def test_cells_to_geometry_random():
+    rng = random.Random(7)
+    tiles = [(x, y, 5) for x in range(12) for y in range(12) if rng.random() < 0.6]
+    geometry = cells_geometry(tiles)
+
+    rings = [ring for polygon in geometry["coordinates"] for ring in polygon]
+    assert all(ring[0] == ring[-1] for ring in rings)
+    for x in range(14):
+        for y in range(14):
+            center = quadbin.cell_to_point(quadbin.tile_to_cell((x, y, 5)))
+            assert covers(geometry, center) is ((x, y, 5) in tiles)
+
+
+def test_cells_to_geometry_empty():
+    assert json.loads(quadbin.cells_to_geometry([])) == {
+        "type": "MultiPolygon",
+        "coordinates": [],
+    }
+
+
+def test_cells_to_geometry_nested():
+    tiles = [(x, y, 4) for x in range(7) for y in range(7)]
+    tiles = [
+        (x, y, z)
+        for x, y, z in tiles
+        if not (1 <= x <= 5 and 1 <= y <= 5) or (2 <= x <= 4 and 2 <= y <= 4)
+    ]
+    tiles.remove((3, 3, 4))
+    # Two holes in a row, the second one sees the first one to its west
+    tiles += [(x, y, 4) for x in range(8, 13) for y in range(3)]
+    tiles.remove((9, 1, 4))
+    tiles.remove((11, 1, 4))
+
+    geometry = cells_geometry(tiles)
+    assert sorted(len(polygon) for polygon in geometry["coordinates"]) == [2, 2, 3]
+
+    island = cells_geometry([(x, y, 4) for x in range(2, 5) for y in range(2, 5)])
+    center = quadbin.cell_to_boundary(quadbin.tile_to_cell((3, 3, 4)))
+    assert [island["coordinates"][0][0], center[::-1]] in geometry["coordinates"]
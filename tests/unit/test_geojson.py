@@ -0,0 +1,69 @@
+import io
+import json
+
+import pytest
+import quadbin
+
+
+CELLS = [5209574053332910079, 5209556461146865663]
+
+
+def test_write_geojson_feature_collection():
+    fp = io.StringIO()
+    count = quadbin.write_geojson(CELLS, fp, properties={"value": [1, 2.5]})
+    document = json.loads(fp.getvalue())
+
+    assert count == 2
+    assert document["type"] == "FeatureCollection"
+    assert [feature["id"] for feature in document["features"]] == [
+        "484c1fffffffffff",
+        "484c0fffffffffff",
+    ]
+    assert [feature["properties"] for feature in document["features"]] == [
+        {"value": 1},
+        {"value": 2.5},
+    ]
+    geometry = document["features"][0]["geometry"]
+    assert geometry["type"] == "Polygon"
+    for coordinate, expected in zip(
+        geometry["coordinates"][0], quadbin.cell_to_boundary(CELLS[0])
+    ):
+        assert coordinate == pytest.approx(expected, abs=1e-9)
+
+
+def test_write_geojson_seq_points():
+    fp = io.StringIO()
+    count = quadbin.write_geojson(
+        iter(CELLS),
+        fp,
+        properties={"name": ["a", None], "flag": [True, False]},
+        geometry="point",
+        precision=3,
+        seq=True,
+        include_id=False,
+        chunk_size=1,
+    )
+    lines = fp.getvalue().splitlines()
+
+    assert count == 2
+    assert len(lines) == 2
+    feature = json.loads(lines[0])
+    assert "id" not in feature
+    assert feature["properties"] == {"flag": True, "name": "a"}
+    assert feature["geometry"] == {"type": "Point", "coordinates": [33.75, -11.178]}
+    assert json.loads(lines[1])["properties"] == {"flag": False, "name": None}
+
+
+def test_write_geojson_empty():
+    fp = io.StringIO()
+    assert quadbin.write_geojson([], fp) == 0
+    assert json.loads(fp.getvalue()) == {"type": "FeatureCollection", "features": []}
+
+    with pytest.raises(ValueError, match="Wrong geometry argument"):
+        quadbin.write_geojson(CELLS, fp, geometry="line")
+    with pytest.raises(ValueError, match="Invalid chunk size"):
+        quadbin.write_geojson(CELLS, fp, chunk_size=0)
+    with pytest.raises(ValueError, match="one value per cell"):
+        quadbin.write_geojson(CELLS, fp, properties={"v": [1]})
+    with pytest.raises(ValueError, match="one value per cell"):
+        quadbin.write_geojson(CELLS[:1], fp, properties={"v": [1, 2]})
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+import quadbin
+
+
+def brute_force_adjacency(tiles, connectivity):
+    positions = dict((tile, i) for i, tile in enumerate(tiles))
+    indptr = [0]
+    indices = []
+    for x, y, z in tiles:
+        neighbors = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx, dy) == (0, 0) or (connectivity == 4 and dx and dy):
+                    continue
+                neighbor = (x + dx, y + dy, z)
+                if neighbor in positions:
+                    neighbors.append(positions[neighbor])
+        indices += sorted(neighbors)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("z", [1, 3, 26])
+def test_cells_adjacency(connectivity, z):
+    rng = random.Random(z)
+    size = 1 << z
+    # Cells around the corners and edges of the grid, which do not wrap
+    origins = [0, size - 4] if size > 4 else [0]
+    tiles = [
+        (x0 + dx, y0 + dy, z)
+        for x0 in origins
+        for y0 in origins
+        for dx in range(min(size, 4))
+        for dy in range(min(size, 4))
+        if rng.random() < 0.7
+    ]
+    rng.shuffle(tiles)
+    cells = [quadbin.tile_to_cell(tile) for tile in tiles]
+
+    indptr, indices = quadbin.cells_adjacency(cells, connectivity)
+    assert (list(indptr), list(indices)) == brute_force_adjacency(tiles, connectivity)
+
+
+def test_cells_adjacency_siblings():
+    cell = quadbin.tile_to_cell((5, 9, 4))
+    directions = ["up", "right", "left", "down"]
+    siblings = [quadbin.cell_sibling(cell, direction) for direction in directions]
+    indptr, indices = quadbin.cells_adjacency([cell] + siblings)
+    start, stop = indptr[0], indptr[1]
+    assert list(indices[start:stop]) == [1, 2, 3, 4]
+
+
+def test_cells_adjacency_empty():
+    indptr, indices = quadbin.cells_adjacency([])
+    assert (list(indptr), list(indices)) == ([0], [])
+    indptr, indices = quadbin.cells_adjacency([5192650370358181887], 8)
+    assert (list(indptr), list(indices)) == ([0, 0], [])
+
+
+def test_cells_adjacency_invalid():
+    with pytest.raises(ValueError, match="Wrong connectivity"):
+        quadbin.cells_adjacency([5209574053332910079], 6)
+    with pytest.raises(ValueError, match="repeated cell"):
+        quadbin.cells_adjacency([5209574053332910079, 5209574053332910079])
+    with pytest.raises(ValueError, match="same resolution"):
+        quadbin.cells_adjacency([5209574053332910079, 5192650370358181887])
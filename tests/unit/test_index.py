@@ -0,0 +1,100 @@
+import pytest
+import quadbin
+
+
+# Cell 5209574053332910079 (res 4) split into three children at res 5,
+# with one of them further split at res 7 except for one of its children
+CHILDREN = quadbin.cell_to_children(5209574053332910079, 5)
+GRANDCHILDREN = quadbin.cell_to_children(CHILDREN[3], 7)
+COVER = CHILDREN[:3] + GRANDCHILDREN[1:]
+
+
+def test_containment_index_cells():
+    index = quadbin.ContainmentIndex(COVER)
+    assert len(index) == len(COVER)
+
+    for cell in COVER:
+        assert index.containing_cell(cell) == cell
+    for child in quadbin.cell_to_children(CHILDREN[1], 10):
+        assert index.containing_cell(child) == CHILDREN[1]
+    for child in quadbin.cell_to_children(GRANDCHILDREN[5], 9):
+        assert index.containing_cell(child) == GRANDCHILDREN[5]
+    for child in quadbin.cell_to_children(GRANDCHILDREN[0], 9):
+        assert index.containing_cell(child) is None
+
+    assert index.containing_cell(5209574053332910079) is None
+    assert index.containing_cell(CHILDREN[3]) is None
+    assert 5209574053332910079 not in index
+    assert (
+        quadbin.point_to_cell(*quadbin.cell_to_point(CHILDREN[2]), resolution=26)
+        in index
+    )
+    assert index.containing_cells([CHILDREN[0], GRANDCHILDREN[0]]) == [
+        CHILDREN[0],
+        None,
+    ]
+
+
+def test_containment_index_points():
+    index = quadbin.ContainmentIndex(COVER)
+    points = [quadbin.cell_to_point(cell) for cell in COVER] + [[0.0, 0.0]]
+    assert index.points_containing_cells(
+        [point[0] for point in points], [point[1] for point in points]
+    ) == COVER + [None]
+
+
+def test_containment_index_overlap():
+    index = quadbin.ContainmentIndex([5209574053332910079, CHILDREN[0]])
+    assert index.containing_cell(GRANDCHILDREN[0]) == 5209574053332910079
+    child = quadbin.cell_to_children(CHILDREN[0], 8)[0]
+    assert index.containing_cell(child) == CHILDREN[0]
+
+
+def test_containment_index_empty():
+    index = quadbin.ContainmentIndex([])
+    assert index.containing_cell(5209574053332910079) is None
+    assert index.points_containing_cells([0.0], [0.0]) == [None]
+    with pytest.raises(ValueError, match="as many longitudes as latitudes"):
+        index.points_containing_cells([0.0, 1.0], [0.0])
+
+
+SQUARE = (
+    '{"type":"Polygon","coordinates":[[[-3.72,40.40],[-3.70,40.40],'
+    "[-3.70,40.42],[-3.72,40.42],[-3.72,40.40]]]}"
+)
+TRIANGLE = (
+    '{"type":"Polygon","coordinates":[[[-3.71,40.41],[-3.62,40.45],'
+    "[-3.55,40.31],[-3.71,40.41]]]}"
+)
+
+
+def test_cover_index():
+    index = quadbin.CoverIndex([SQUARE, TRIANGLE], 14, ids=["square", "triangle"])
+    square = set(quadbin.geometry_to_cells(SQUARE, 14))
+    triangle = set(quadbin.geometry_to_cells(TRIANGLE, 14))
+    assert len(index) == len(square | triangle)
+    assert list(index.cells) == sorted(square | triangle)
+
+    for cell in square | triangle:
+        expected = []
+        if cell in square:
+            expected.append("square")
+        if cell in triangle:
+            expected.append("triangle")
+        assert index.cell_features(cell) == expected
+    assert index.cell_features(5209574053332910079) == []
+
+
+def test_cover_index_join_points():
+    index = quadbin.CoverIndex([SQUARE, TRIANGLE], 17, flag_boundary=True)
+    points, features, boundary = index.join_points(
+        [-3.715, -3.60, 0.0, -3.705, -3.7001], [40.405, 40.40, 0.0, 40.413, 40.41]
+    )
+    assert points == [0, 1, 3, 3, 4, 4]
+    assert features == [0, 1, 0, 1, 0, 1]
+    assert boundary == [False, False, False, True, True, False]
+
+
+def test_cover_index_invalid_ids():
+    with pytest.raises(ValueError, match="Invalid ids"):
+        quadbin.CoverIndex([SQUARE, TRIANGLE], 14, ids=[1])
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+import quadbin
+from quadbin import lookup
+
+
+CHILDREN = quadbin.cell_to_children(5209574053332910079, 5)
+GRANDCHILDREN = quadbin.cell_to_children(CHILDREN[3], 7)
+COVER = CHILDREN[:3] + GRANDCHILDREN[1:]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "cover.qblt")
+    values = [i * 100 for i in range(len(COVER))]
+    assert quadbin.write_lookup_table(reversed(COVER), reversed(values), path) == 18
+    return path
+
+
+def test_lookup_table(path):
+    with quadbin.LookupTable(path) as table:
+        assert len(table) == len(COVER)
+        for i, cell in enumerate(COVER):
+            assert cell in table
+            assert table.get(cell) == i * 100
+        assert 5209574053332910079 not in table
+        assert table.get(5209574053332910079) is None
+        assert table.get(0, -1) == -1
+        assert table.get_many([COVER[1], GRANDCHILDREN[0]]) == [100, None]
+
+
+def test_lookup_table_containing_value(path):
+    with quadbin.LookupTable(path) as table:
+        assert table.resolution == 7
+        child = quadbin.cell_to_children(CHILDREN[1], 9)[3]
+        assert table.containing_value(child) == 100
+        assert table.containing_value(GRANDCHILDREN[2]) == 400
+        assert table.containing_value(GRANDCHILDREN[0]) is None
+        points = [quadbin.cell_to_point(cell) for cell in COVER] + [[0.0, 0.0]]
+        assert table.points_values(
+            [point[0] for point in points], [point[1] for point in points], -1
+        ) == [i * 100 for i in range(len(COVER))] + [-1]
+
+
+def test_lookup_table_packed_array(path, monkeypatch):
+    monkeypatch.setattr(lookup.sys, "byteorder", "big")
+    with quadbin.LookupTable(path) as table:
+        assert isinstance(table.keys, lookup.PackedArray)
+        for i, cell in enumerate(COVER):
+            assert table.get(cell) == i * 100
+        assert table.get(0) is None
+        with pytest.raises(IndexError):
+            table.keys[len(COVER)]
+
+
+def test_lookup_table_invalid(tmp_path):
+    path = str(tmp_path / "invalid.qblt")
+    with pytest.raises(ValueError, match="repeated cell"):
+        quadbin.write_lookup_table([COVER[0], COVER[0]], [1, 2], path)
+    with pytest.raises(ValueError, match="should have one value per cell"):
+        quadbin.write_lookup_table(COVER, [1, 2], path)
+    assert not os.path.exists(path)
+
+    with open(path, "wb") as f:
+        f.write(b"QBLT\1")
+    with pytest.raises(ValueError, match="truncated header"):
+        quadbin.LookupTable(path)
+    with open(path, "wb") as f:
+        f.write(b"\0" * 24)
+    with pytest.raises(ValueError, match="unknown format"):
+        quadbin.LookupTable(path)
+
+    quadbin.write_lookup_table(COVER, COVER, path)
+    with open(path, "rb+") as f:
+        f.truncate(100)
+    with pytest.raises(ValueError, match="truncated data"):
+        quadbin.LookupTable(path)
+
+
+def test_lookup_table_empty(tmp_path):
+    path = str(tmp_path / "empty.qblt")
+    assert quadbin.write_lookup_table([], [], path) == 0
+    table = quadbin.LookupTable(path)
+    assert len(table) == 0
+    assert table.get(5209574053332910079) is None
+    assert table.points_values([0.0], [0.0]) == [None]
+    table.close()
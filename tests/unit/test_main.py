@@ -1,3 +1,6 @@
+import json
+import math
+
 import pytest
 import quadbin
 
@@ -61,6 +64,45 @@ def test_point_to_cell():
         assert quadbin.point_to_cell(33.75, -11.178401873711776, 27)
 
 
+def test_points_to_cells():
+    longitudes = [33.75, 0.0, 0.0]
+    latitudes = [-11.178401873711776, 90, -88]
+    assert quadbin.points_to_cells(longitudes, latitudes, 4) == [
+        quadbin.point_to_cell(longitude, latitude, 4)
+        for longitude, latitude in zip(longitudes, latitudes)
+    ]
+    assert quadbin.points_to_cells([], [], 4) == []
+
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        assert quadbin.points_to_cells(longitudes, latitudes, 27)
+    with pytest.raises(ValueError, match="as many longitudes as latitudes"):
+        quadbin.points_to_cells([1, 2, 3], [1], 4)
+
+
+def test_points_to_cell_counts():
+    longitudes = [33.75, 0.0, 33.7, 0.0, 33.75]
+    latitudes = [-11.178401873711776, 90, -11.1, -88, -11.2]
+    cells = quadbin.points_to_cells(longitudes, latitudes, 4)
+    assert quadbin.points_to_cell_counts(longitudes, latitudes, 4) == (
+        sorted(set(cells)),
+        [cells.count(cell) for cell in sorted(set(cells))],
+    )
+    assert quadbin.points_to_cell_counts(
+        longitudes, latitudes, 4, weights=[1.0, 2.0, 3.0, 4.0, 5.0]
+    ) == (
+        [5207304661333180415, 5209574053332910079, 5210295332960731135],
+        [2.0, 9.0, 4.0],
+    )
+    assert quadbin.points_to_cell_counts([], [], 4) == ([], [])
+
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        assert quadbin.points_to_cell_counts(longitudes, latitudes, -1)
+    with pytest.raises(ValueError, match="as many longitudes as latitudes"):
+        quadbin.points_to_cell_counts([1, 2, 3], [1, 2], 4)
+    with pytest.raises(ValueError, match="one weight per point"):
+        quadbin.points_to_cell_counts([1, 2, 3], [1, 2, 3], 4, weights=[5])
+
+
 def test_cell_to_boundary():
     coordinates = [
         [22.5, 0.0],
@@ -108,6 +150,109 @@ def test_string_to_index():
     assert quadbin.string_to_index("484c1fffffffffff") == 5209574053332910079
 
 
+def test_indexes_to_strings():
+    indexes = [5209574053332910079, 5209556461146865663]
+    strings = ["484c1fffffffffff", "484c0fffffffffff"]
+    assert quadbin.indexes_to_strings(indexes) == strings
+    assert quadbin.indexes_to_strings(iter(indexes), as_bytes=True) == (
+        b"484c1fffffffffff484c0fffffffffff"
+    )
+    assert quadbin.indexes_to_strings([]) == []
+    with pytest.raises(ValueError, match="Invalid index"):
+        quadbin.indexes_to_strings([-1])
+    with pytest.raises(ValueError, match="Invalid index"):
+        quadbin.indexes_to_strings([1 << 64])
+
+
+def test_strings_to_indexes():
+    indexes = [5209574053332910079, 5209556461146865663]
+    strings = ["484c1fffffffffff", "484C0FFFFFFFFFFF"]
+    assert quadbin.strings_to_indexes(strings) == indexes
+    assert quadbin.strings_to_indexes(b"484c1fffffffffff484c0fffffffffff") == indexes
+    assert quadbin.strings_to_indexes(bytearray(b"484c1fffffffffff")) == indexes[:1]
+    assert quadbin.strings_to_indexes([]) == []
+    assert quadbin.strings_to_indexes(["0000000000000000"], validate=False) == [0]
+
+
+@pytest.mark.parametrize(
+    "strings,error",
+    [
+        (["484c1fffffffffff", "484c1ffff"], "should have 16 characters"),
+        (b"484c1fffffffffff484c", "should have 16-byte records"),
+        (["484c1fffffffffzz"], "should be hexadecimal"),
+        (["0000000000000000"], "Invalid index: 0"),
+        (["484c1ffffffffffe"], "Invalid index"),
+    ],
+)
+def test_strings_to_indexes_invalid(strings, error):
+    with pytest.raises(ValueError, match=error):
+        quadbin.strings_to_indexes(strings)
+
+
+def test_strings_to_indexes_numpy():
+    np = pytest.importorskip("numpy")
+    indexes = [5209574053332910079, 5209556461146865663]
+    strings = ["484c1fffffffffff", "484C0FFFFFFFFFFF"]
+    assert quadbin.strings_to_indexes(np.array(strings)) == indexes
+    assert quadbin.strings_to_indexes(np.array(strings, dtype="S16")) == indexes
+
+    for invalid in [
+        np.array(["484c1fffffffffffABC"]),
+        np.array([b"484c1fffffffffffABC"]),
+        np.array(["484c1fffffffffff", "484c1fff"]),
+        np.array(["484c1fff"]),
+    ]:
+        with pytest.raises(ValueError, match="should have 16 characters"):
+            quadbin.strings_to_indexes(invalid)
+
+
+def test_indexes_to_int64():
+    assert quadbin.indexes_to_int64([5209574053332910079, (1 << 64) - 1]) == [
+        5209574053332910079,
+        -1,
+    ]
+    assert quadbin.int64_to_indexes([5209574053332910079, -1]) == [
+        5209574053332910079,
+        (1 << 64) - 1,
+    ]
+    with pytest.raises(ValueError, match="should be a 64-bit integer"):
+        quadbin.indexes_to_int64([1 << 64])
+    with pytest.raises(ValueError, match="should be a 64-bit integer"):
+        quadbin.int64_to_indexes([-(1 << 63) - 1])
+
+
+def test_indexes_to_int64_numpy():
+    np = pytest.importorskip("numpy")
+    indexes = np.array([5209574053332910079, (1 << 64) - 1], dtype=np.uint64)
+    values = quadbin.indexes_to_int64(indexes)
+    assert values.dtype == np.int64
+    assert values.tolist() == [5209574053332910079, -1]
+    assert np.shares_memory(values, indexes)
+    assert quadbin.int64_to_indexes(values).tolist() == indexes.tolist()
+
+    with pytest.raises(ValueError, match="should be a 64-bit integer"):
+        quadbin.indexes_to_int64(np.array([1, 2], dtype=np.int32))
+    with pytest.raises(ValueError, match="should be a 64-bit integer"):
+        quadbin.int64_to_indexes(np.array([1, 2, 3], dtype=np.int16))
+
+
+def test_indexes_to_int64_arrow():
+    pa = pytest.importorskip("pyarrow")
+    indexes = pa.array([5209574053332910079, (1 << 64) - 1], pa.uint64())
+    values = quadbin.indexes_to_int64(indexes)
+    assert values.type == pa.int64()
+    assert values.to_pylist() == [5209574053332910079, -1]
+    chunked = quadbin.int64_to_indexes(pa.chunked_array([values, values]))
+    assert chunked.type == pa.uint64()
+    assert chunked.to_pylist() == indexes.to_pylist() * 2
+    with pytest.raises(ValueError, match="should be a 64-bit integer"):
+        quadbin.indexes_to_int64(pa.array([1, 2], pa.int32()))
+    assert quadbin.indexes_to_strings(indexes.slice(0, 1)) == ["484c1fffffffffff"]
+    assert quadbin.cell_areas(pa.chunked_array([indexes.slice(0, 1)])) == [
+        quadbin.cell_area(5209574053332910079)
+    ]
+
+
 def test_k_ring():
     assert quadbin.k_ring(5209574053332910079, 0) == [
         5209574053332910079,
@@ -705,3 +850,350 @@ def test_cell_area():
     assert quadbin.cell_area(5209574053332910079) == pytest.approx(
         6023040823252.6641, rel=1e-2
     )
+
+
+def test_cell_areas():
+    cells = [5209574053332910079, 5209556461146865663, 5192650370358181887]
+    assert quadbin.cell_areas(cells) == [quadbin.cell_area(cell) for cell in cells]
+    assert quadbin.cell_areas(iter([])) == []
+
+
+def test_cells_area():
+    cells = quadbin.cell_to_children(5209574053332910079, 7) + [
+        5209556461146865663,
+        5192650370358181887,
+    ]
+    assert quadbin.cells_area(cells) == pytest.approx(sum(quadbin.cell_areas(cells)))
+    assert quadbin.cells_area([]) == 0.0
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        '{"type":"Point","coordinates":[-3.7118983268737793,40.4116172037252]}',
+        '{"type":"LineString","coordinates":[[-3.71,40.41],[-3.62,40.45]]}',
+        '{"type":"Polygon","coordinates":[[[-3.71,40.41],[-3.62,40.45],'
+        "[-3.55,40.31],[-3.71,40.41]]]}",
+        '{"type":"MultiPolygon","coordinates":[[[[-3.71,40.41],[-3.62,40.45],'
+        "[-3.55,40.31],[-3.71,40.41]]],[[[-3.65,40.40],[-3.5,40.40],"
+        "[-3.5,40.2],[-3.65,40.2],[-3.65,40.40]]]]}",
+        '{"type":"GeometryCollection","geometries":['
+        '{"type":"Point","coordinates":[-3.7118983268737793,40.4116172037252]},'
+        '{"type":"LineString","coordinates":[[-3.71,40.41],[-3.62,40.45]]}]}',
+    ],
+)
+def test_geometry_area_covered(geometry):
+    for resolution in [0, 10, 14]:
+        cells = quadbin.geometry_to_cells(geometry, resolution)
+        assert quadbin.geometry_area_covered(geometry, resolution) == pytest.approx(
+            sum(quadbin.cell_areas(cells))
+        )
+
+
+@pytest.mark.parametrize("op", ["sum", "count", "min", "max", "mean"])
+@pytest.mark.parametrize("k", [0, 1, 2])
+def test_k_ring_aggregate(op, k):
+    # Sparse cells at resolution 4, including the edges of the grid
+    cells = [
+        quadbin.tile_to_cell((x, y, 4))
+        for x, y in [
+            (0, 0),
+            (1, 0),
+            (0, 2),
+            (9, 8),
+            (10, 8),
+            (9, 10),
+            (11, 9),
+            (15, 15),
+        ]
+    ]
+    values = [3, -1, 4, 1, 5, 9, 2, 6]
+    by_cell = dict(zip(cells, values))
+
+    expected = []
+    for cell in cells:
+        x, y, z = quadbin.cell_to_tile(cell)
+        neighbors = [
+            quadbin.tile_to_cell((rx, ry, z))
+            for rx in range(max(x - k, 0), min(x + k, 15) + 1)
+            for ry in range(max(y - k, 0), min(y + k, 15) + 1)
+        ]
+        ring = [by_cell[n] for n in neighbors if n in by_cell]
+        expected.append(
+            {
+                "sum": sum(ring),
+                "count": len(ring),
+                "min": min(ring),
+                "max": max(ring),
+                "mean": sum(ring) / len(ring),
+            }[op]
+        )
+
+    assert quadbin.k_ring_aggregate(cells, values, k, op) == expected
+
+
+def test_k_ring_aggregate_invalid():
+    assert quadbin.k_ring_aggregate([], [], 1) == []
+    assert quadbin.k_ring_aggregate(
+        [5209574053332910079, 5209574053332910079], [1, 2], 1
+    ) == [3, 3]
+    with pytest.raises(ValueError, match="Invalid negative distance"):
+        quadbin.k_ring_aggregate([5209574053332910079], [1], -1)
+    with pytest.raises(ValueError, match="Wrong op argument"):
+        quadbin.k_ring_aggregate([5209574053332910079], [1], 1, op="median")
+    with pytest.raises(ValueError, match="should have the same resolution"):
+        quadbin.k_ring_aggregate([5209574053332910079, 5192650370358181887], [1, 2], 1)
+    with pytest.raises(ValueError, match="should have one value per cell"):
+        quadbin.k_ring_aggregate([5209574053332910079], [1, 2], 1)
+
+
+def test_tile_to_cell_range():
+    cell = quadbin.tile_to_cell((9, 8, 4))
+    assert quadbin.tile_to_cell_range(9, 8, 4, 4) == (cell, cell)
+    for resolution in [5, 7]:
+        children = quadbin.cell_to_children(cell, resolution)
+        assert quadbin.tile_to_cell_range(9, 8, 4, resolution) == (
+            min(children),
+            max(children),
+        )
+    assert quadbin.tile_to_cell_range(0, 0, 0, 0) == (
+        5192650370358181887,
+        5192650370358181887,
+    )
+
+
+def test_tile_to_cell_range_invalid():
+    with pytest.raises(ValueError, match="Invalid tile"):
+        quadbin.tile_to_cell_range(16, 0, 4, 5)
+    with pytest.raises(ValueError, match="Invalid tile"):
+        quadbin.tile_to_cell_range(0, -1, 4, 5)
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.tile_to_cell_range(0, 0, 4, 3)
+
+
+def test_tiles_to_cell_ranges():
+    tiles = [(9, 8, 4), (0, 0, 1), (3, 2, 2)]
+    assert quadbin.tiles_to_cell_ranges(tiles, 6) == [
+        quadbin.tile_to_cell_range(x, y, z, 6) for x, y, z in tiles
+    ]
+    assert quadbin.tiles_to_cell_ranges([], 6) == []
+
+
+def destination_point(longitude, latitude, bearing, distance):
+    latitude = math.radians(latitude)
+    distance = distance / quadbin.utils.EARTH_RADIUS
+    sin_latitude = math.sin(latitude) * math.cos(distance) + math.cos(
+        latitude
+    ) * math.sin(distance) * math.cos(bearing)
+    delta = math.atan2(
+        math.sin(bearing) * math.sin(distance) * math.cos(latitude),
+        math.cos(distance) - math.sin(latitude) * sin_latitude,
+    )
+    return longitude + math.degrees(delta), math.degrees(math.asin(sin_latitude))
+
+
+@pytest.mark.parametrize(
+    "longitude,latitude,radius,resolution",
+    [
+        (-3.7038, 40.4168, 50000, 8),
+        (179.9, 80, 200000, 7),
+        (-179.99, -60, 30000, 9),
+        (10, 88, 500000, 6),
+    ],
+)
+def test_point_radius_to_cells(longitude, latitude, radius, resolution):
+    cells = quadbin.point_radius_to_cells(longitude, latitude, radius, resolution)
+    assert cells == sorted(set(cells))
+
+    # Every point of the circle is covered
+    for bearing in range(0, 360, 5):
+        for fraction in [0.5, 0.999]:
+            point = destination_point(
+                longitude, latitude, math.radians(bearing), radius * fraction
+            )
+            assert quadbin.point_to_cell(point[0], point[1], resolution) in cells
+
+    # Cells far from the circle are not included
+    far = destination_point(longitude, latitude, 0.5, radius * 3)
+    assert quadbin.point_to_cell(far[0], far[1], resolution) not in cells
+
+
+def test_point_radius_to_cells_zero_radius():
+    assert quadbin.point_radius_to_cells(-3.7038, 40.4168, 0, 10) == [
+        quadbin.point_to_cell(-3.7038, 40.4168, 10)
+    ]
+
+
+def test_point_radius_to_cells_compact():
+    cells = quadbin.point_radius_to_cells(-3.7038, 40.4168, 300000, 9)
+    compacted = quadbin.point_radius_to_cells(-3.7038, 40.4168, 300000, 9, compact=True)
+    assert len(compacted) < len(cells)
+    assert set(quadbin.get_resolution(cell) for cell in compacted) == set([7, 8, 9])
+
+    expanded = []
+    for cell in compacted:
+        if quadbin.get_resolution(cell) == 9:
+            expanded.append(cell)
+        else:
+            expanded += quadbin.cell_to_children(cell, 9)
+    assert sorted(expanded) == cells
+
+
+def test_point_radius_to_cells_invalid():
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.point_radius_to_cells(0, 0, 1000, 27)
+    with pytest.raises(ValueError, match="Invalid negative radius"):
+        quadbin.point_radius_to_cells(0, 0, -1, 10)
+
+
+def lonlat_to_mercator(longitude, latitude):
+    x = math.radians(longitude) * 6378137
+    y = math.log(math.tan(math.pi / 4 + math.radians(latitude) / 2)) * 6378137
+    return x, y
+
+
+@pytest.mark.parametrize(
+    "longitude,latitude",
+    [(-3.7038, 40.4168), (151.2, -33.87), (-122.42, 37.77), (0.001, -0.001)],
+)
+@pytest.mark.parametrize("resolution", [0, 4, 10, 17, 26])
+def test_mercator_to_cell(longitude, latitude, resolution):
+    x, y = lonlat_to_mercator(longitude, latitude)
+    assert quadbin.mercator_to_cell(x, y, resolution) == quadbin.point_to_cell(
+        longitude, latitude, resolution
+    )
+
+
+def test_mercator_to_cell_edges():
+    extent = quadbin.utils.MERCATOR_EXTENT
+    # The antimeridian wraps to the first column
+    assert quadbin.mercator_to_cell(extent, 0, 4) == quadbin.point_to_cell(180, 0, 4)
+    assert quadbin.mercator_to_cell(-extent, 0, 4) == quadbin.point_to_cell(-180, 0, 4)
+    # Points beyond the grid are clipped to the first and last rows
+    assert quadbin.mercator_to_cell(0, 2 * extent, 4) == quadbin.point_to_cell(0, 89, 4)
+    assert quadbin.mercator_to_cell(0, -2 * extent, 4) == quadbin.point_to_cell(
+        0, -89, 4
+    )
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.mercator_to_cell(0, 0, 27)
+
+
+def test_mercator_to_cells():
+    points = [(-3.7038, 40.4168), (151.2, -33.87), (-122.42, 37.77)]
+    xs, ys = zip(*[lonlat_to_mercator(*point) for point in points])
+    assert quadbin.mercator_to_cells(xs, ys, 12) == quadbin.points_to_cells(
+        [longitude for longitude, _ in points],
+        [latitude for _, latitude in points],
+        12,
+    )
+    assert quadbin.mercator_to_cells([], [], 12) == []
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.mercator_to_cells([0], [0], -1)
+    with pytest.raises(ValueError, match="as many xs as ys"):
+        quadbin.mercator_to_cells(xs, ys[:2], 12)
+
+
+@pytest.mark.parametrize("direction", ["up", "right", "left", "down"])
+def test_cell_siblings(direction):
+    cells = [
+        quadbin.tile_to_cell((x, y, z))
+        for z in [0, 1, 4, 26]
+        for x in set([0, 1, (1 << z) - 1])
+        for y in set([0, 1, (1 << z) - 1])
+        if x < (1 << z) and y < (1 << z)
+    ]
+    expected = [quadbin.cell_sibling(cell, direction) for cell in cells]
+
+    siblings, valid = quadbin.cell_siblings(cells, direction)
+    assert valid == [sibling is not None for sibling in expected]
+    assert siblings == [sibling or 0 for sibling in expected]
+
+    code = quadbin.utils.DIRECTIONS[direction]
+    assert quadbin.cell_siblings(cells, code) == (siblings, valid)
+    assert quadbin.cell_siblings(cells, direction.upper()) == (siblings, valid)
+
+    all_siblings, all_valid = quadbin.cell_siblings(cells)
+    assert sorted(all_siblings) == ["down", "left", "right", "up"]
+    assert all_siblings[direction] == siblings
+    assert all_valid[direction] == valid
+
+
+def test_cell_siblings_invalid():
+    assert quadbin.cell_siblings([], "up") == ([], [])
+    with pytest.raises(ValueError, match="Wrong direction argument passed to sibling"):
+        quadbin.cell_siblings([5209574053332910079], "wrong")
+    with pytest.raises(ValueError, match="Wrong direction argument passed to sibling"):
+        quadbin.cell_siblings([5209574053332910079], 4)
+
+
+def reference_grid_path(origin, destination):
+    from fractions import Fraction
+
+    x0, y0, z = quadbin.cell_to_tile(origin)
+    x1, y1, _ = quadbin.cell_to_tile(destination)
+    steps = abs(x1 - x0) + abs(y1 - y0)
+    x, y = x0, y0
+    tiles = [(x, y, z)]
+    for _ in range(steps):
+        # Next column and row edges crossed, as fractions of the line
+        tx = Fraction(2 * abs(x - x0) + 1, 2 * abs(x1 - x0)) if x1 != x0 else 2
+        ty = Fraction(2 * abs(y - y0) + 1, 2 * abs(y1 - y0)) if y1 != y0 else 2
+        if tx < ty:
+            x += 1 if x1 > x0 else -1
+        else:
+            y += 1 if y1 > y0 else -1
+        tiles.append((x, y, z))
+    return [quadbin.tile_to_cell(tile) for tile in tiles]
+
+
+@pytest.mark.parametrize(
+    "origin,destination",
+    [
+        ((2, 3, 4), (13, 7, 4)),
+        ((13, 7, 4), (2, 3, 4)),
+        ((5, 5, 4), (5, 0, 4)),
+        ((0, 9, 4), (15, 9, 4)),
+        ((3, 3, 4), (7, 7, 4)),
+        ((6, 1, 4), (6, 1, 4)),
+        (((1 << 26) - 10, 5, 26), ((1 << 26) - 1, 12, 26)),
+    ],
+)
+def test_grid_path_cells(origin, destination):
+    origin = quadbin.tile_to_cell(origin)
+    destination = quadbin.tile_to_cell(destination)
+    cells = quadbin.grid_path_cells(origin, destination)
+    assert cells == reference_grid_path(origin, destination)
+    assert cells[0] == origin
+    assert cells[-1] == destination
+
+
+def test_grid_path_cells_line():
+    origin = quadbin.tile_to_cell((2, 3, 4))
+    destination = quadbin.tile_to_cell((13, 7, 4))
+    line = {
+        "type": "LineString",
+        "coordinates": [
+            quadbin.cell_to_point(origin),
+            quadbin.cell_to_point(destination),
+        ],
+    }
+    assert set(quadbin.grid_path_cells(origin, destination)) == set(
+        quadbin.geometry_to_cells(json.dumps(line), 4)
+    )
+
+
+def test_grid_path_cells_invalid():
+    with pytest.raises(ValueError, match="same resolution"):
+        quadbin.grid_path_cells(5209574053332910079, 5192650370358181887)
+
+
+def test_grid_paths_cells():
+    origins = [quadbin.tile_to_cell((2, 3, 4)), quadbin.tile_to_cell((6, 1, 4))]
+    destinations = [quadbin.tile_to_cell((13, 7, 4)), quadbin.tile_to_cell((0, 9, 4))]
+    assert quadbin.grid_paths_cells(origins, destinations) == [
+        quadbin.grid_path_cells(origin, destination)
+        for origin, destination in zip(origins, destinations)
+    ]
+    assert quadbin.grid_paths_cells([], []) == []
+    with pytest.raises(ValueError, match="as many origins as destinations"):
+        quadbin.grid_paths_cells(origins, destinations[:1])
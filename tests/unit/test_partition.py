@@ -0,0 +1,77 @@
+import pytest
+import quadbin
+
+
+CELLS = quadbin.cell_to_children(5209574053332910079, 8)
+
+
+def test_partition_cells():
+    ranges, weights = quadbin.partition_cells(reversed(CELLS), 4, 6)
+    assert weights == [64, 64, 64, 64]
+
+    # The ranges cover the whole space of resolution 8
+    root = quadbin.cell_to_children_range(5192650370358181887, 8)
+    assert ranges[0][0] == root[0]
+    assert ranges[-1][1] == root[1]
+    step = 1 << (52 - 16)
+    for previous, following in zip(ranges, ranges[1:]):
+        assert previous[1] + step == following[0]
+        parent = quadbin.cell_to_parent(following[0], 6)
+        assert quadbin.cell_to_children_range(parent, 8)[0] == following[0]
+
+    for (start, stop), weight in zip(ranges, weights):
+        assert len([cell for cell in CELLS if start <= cell <= stop]) == weight
+
+
+def test_partition_cells_weights():
+    weights = [100 if i < 4 else 1 for i in range(len(CELLS))]
+    ranges, range_weights = quadbin.partition_cells(CELLS, 2, 8, weights)
+    assert range_weights == [300, 352]
+
+    ranges, range_weights = quadbin.partition_cells(CELLS, 3, 5)
+    assert range_weights == [64, 64, 128]
+    ranges, range_weights = quadbin.partition_cells(CELLS, 10, 4)
+    assert ranges == [quadbin.cell_to_children_range(5192650370358181887, 8)]
+    assert range_weights == [256]
+    assert quadbin.partition_cells([], 2, 4) == ([], [])
+
+
+def test_partition_cells_skewed():
+    # 16 groups, the first one heavier than all the others together
+    cells = quadbin.cell_to_children(5209574053332910079, 6)
+    weights = [100 if cell == cells[0] else 1 for cell in cells]
+    ranges, range_weights = quadbin.partition_cells(cells, 4, 6, weights)
+    assert len(ranges) == 4
+    assert range_weights == [100, 5, 5, 5]
+
+    ranges, range_weights = quadbin.partition_cells(cells, 16, 6, weights)
+    assert range_weights == [100] + [1] * 15
+    ranges, range_weights = quadbin.partition_cells(cells, 20, 6, weights)
+    assert len(ranges) == 16
+
+
+def test_partition_cells_invalid():
+    with pytest.raises(ValueError, match="Invalid number of ranges"):
+        quadbin.partition_cells(CELLS, 0, 4)
+    with pytest.raises(ValueError, match="should have the same resolution"):
+        quadbin.partition_cells(CELLS + [5209574053332910079], 2, 4)
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.partition_cells(CELLS, 2, 9)
+    with pytest.raises(ValueError, match="should have one weight per cell"):
+        quadbin.partition_cells(CELLS, 2, 4, [1, 2])
+
+
+def test_cell_to_children_range():
+    children = quadbin.cell_to_children(5209574053332910079, 7)
+    assert quadbin.cell_to_children_range(5209574053332910079, 7) == (
+        min(children),
+        max(children),
+    )
+    assert quadbin.cell_to_children_range(5209574053332910079, 4) == (
+        5209574053332910079,
+        5209574053332910079,
+    )
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.cell_to_children_range(5209574053332910079, 3)
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.cell_to_children_range(5209574053332910079, 27)
@@ -0,0 +1,118 @@
+import pytest
+import quadbin
+
+
+CELLS = quadbin.cell_to_children(5209574053332910079, 6)
+
+
+def test_build_pyramid():
+    values = list(range(len(CELLS)))
+    pyramid = quadbin.build_pyramid(reversed(CELLS), reversed(values), 3)
+    assert sorted(pyramid) == [3, 4, 5, 6]
+
+    assert pyramid[6]["cells"] == sorted(CELLS)
+    assert pyramid[6]["count"] == [1] * 16
+
+    for resolution in [3, 4, 5]:
+        level = pyramid[resolution]
+        parents = [quadbin.cell_to_parent(cell, resolution) for cell in CELLS]
+        assert level["cells"] == sorted(set(parents))
+        for i, parent in enumerate(level["cells"]):
+            children = [v for v, p in zip(values, parents) if p == parent]
+            assert level["sum"][i] == sum(children)
+            assert level["count"][i] == len(children)
+            assert level["min"][i] == min(children)
+            assert level["max"][i] == max(children)
+            assert level["mean"][i] == sum(children) / len(children)
+
+    assert pyramid[4]["cells"] == [5209574053332910079]
+    assert pyramid[3]["sum"] == [120]
+
+
+def test_build_pyramid_duplicates():
+    pyramid = quadbin.build_pyramid([CELLS[0], CELLS[0]], [1.0, 3.0], 6)
+    assert pyramid == {
+        6: {
+            "cells": [CELLS[0]],
+            "sum": [4.0],
+            "count": [2],
+            "min": [1.0],
+            "max": [3.0],
+            "mean": [2.0],
+        }
+    }
+    assert quadbin.build_pyramid([], []) == {}
+
+
+def test_build_pyramid_invalid():
+    with pytest.raises(ValueError, match="should have the same resolution"):
+        quadbin.build_pyramid([CELLS[0], 5209574053332910079], [1, 2])
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.build_pyramid(CELLS, CELLS, 7)
+    with pytest.raises(ValueError, match="should have one value per cell"):
+        quadbin.build_pyramid(CELLS, [1, 2])
+
+
+def test_pyramid_accumulator():
+    accumulator = quadbin.PyramidAccumulator(6, 3)
+    values = list(range(len(CELLS)))
+    accumulator.add(CELLS[:10], values[:10])
+    accumulator.add(CELLS[10:], values[10:])
+    accumulator.add(CELLS[:2])
+
+    pyramid = quadbin.build_pyramid(
+        CELLS + CELLS[:2], values + [1, 1], min_resolution=3
+    )
+    for resolution in [3, 4, 5, 6]:
+        snapshot = accumulator.snapshot(resolution)
+        for key in ["cells", "sum", "count", "mean"]:
+            assert snapshot[key] == pyramid[resolution][key]
+
+    assert accumulator.get(5209574053332910079) == (122, 18)
+    assert accumulator.get(CELLS[0]) == (1, 2)
+    parent = pyramid[5]["cells"][0]
+    assert accumulator.get(parent) == (
+        pyramid[5]["sum"][0],
+        pyramid[5]["count"][0],
+    )
+    assert accumulator.get(5209556461146865663) == (0, 0)
+
+
+def test_pyramid_accumulator_snapshots():
+    accumulator = quadbin.PyramidAccumulator(6, 4)
+    accumulator.add(CELLS[8:])
+    first = accumulator.snapshot(6)
+    assert first["cells"] == sorted(CELLS[8:])
+
+    # Snapshots are kept sorted as new cells arrive between them
+    accumulator.add(CELLS[:8] + CELLS[8:10])
+    assert first["cells"] == sorted(CELLS[8:])
+    assert accumulator.snapshot(6)["cells"] == sorted(CELLS)
+    assert accumulator.snapshot(6)["count"] == [
+        2 if cell in CELLS[8:10] else 1 for cell in sorted(CELLS)
+    ]
+    assert accumulator.snapshot(4) == {
+        "cells": [5209574053332910079],
+        "sum": [18],
+        "count": [18],
+        "mean": [1.0],
+    }
+
+
+def test_pyramid_accumulator_invalid():
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.PyramidAccumulator(27)
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.PyramidAccumulator(5, 6)
+
+    accumulator = quadbin.PyramidAccumulator(6, 3)
+    with pytest.raises(ValueError, match="should be at resolution 6"):
+        accumulator.add([5209574053332910079])
+    with pytest.raises(ValueError, match="should have one value per cell"):
+        accumulator.add(CELLS, [1, 2])
+    assert accumulator.get(5209574053332910079) == (0, 0)
+    assert accumulator.snapshot(6)["cells"] == []
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        accumulator.get(5192650370358181887)
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        accumulator.snapshot(2)
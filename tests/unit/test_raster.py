@@ -0,0 +1,108 @@
+import pytest
+import quadbin
+
+
+RASTER = [
+    [1.0, 2.0, 3.0],
+    [4.0, float("nan"), 6.0],
+]
+
+
+def test_raster_to_cells():
+    cells, values = quadbin.raster_to_cells(RASTER, 4, x0=8, y0=7)
+    assert cells == [
+        quadbin.tile_to_cell((x, y, 4)) for y in range(7, 9) for x in range(8, 11)
+    ]
+    assert values[:4] == [1.0, 2.0, 3.0, 4.0]
+    assert values[5] == 6.0
+
+    cells, values = quadbin.raster_to_cells(RASTER, 4, x0=8, y0=7, nodata=2.0)
+    assert len(cells) == 5
+    assert values[:3] == [1.0, 3.0, 4.0]
+
+    cells, values = quadbin.raster_to_cells(RASTER, 4, x0=8, y0=7, nodata=float("nan"))
+    assert cells == [
+        quadbin.tile_to_cell(tile)
+        for tile in [(8, 7, 4), (9, 7, 4), (10, 7, 4), (8, 8, 4), (10, 8, 4)]
+    ]
+    assert values == [1.0, 2.0, 3.0, 4.0, 6.0]
+
+    assert quadbin.raster_to_cells([], 4) == ([], [])
+    assert quadbin.raster_to_cells([[7]], 0) == ([5192650370358181887], [7])
+
+
+def test_raster_to_cells_numpy():
+    np = pytest.importorskip("numpy")
+    raster = np.arange(6, dtype=np.float32).reshape(2, 3)
+    cells, values = quadbin.raster_to_cells(raster, 26, x0=100, y0=200)
+    assert cells[-1] == quadbin.tile_to_cell((102, 201, 26))
+    assert values == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+@pytest.mark.parametrize(
+    "raster,z,x0,y0",
+    [
+        (RASTER, 1, 0, 0),
+        (RASTER, 4, -1, 0),
+        (RASTER, 4, 14, 0),
+        (RASTER, 4, 0, 15),
+        ([[1, 2], [3]], 4, 0, 0),
+    ],
+)
+def test_raster_to_cells_invalid(raster, z, x0, y0):
+    with pytest.raises(ValueError, match="Invalid raster"):
+        quadbin.raster_to_cells(raster, z, x0, y0)
+
+
+def test_raster_to_cells_invalid_resolution():
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.raster_to_cells(RASTER, 27)
+
+
+def test_cells_to_raster():
+    raster = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+    cells, values = quadbin.raster_to_cells(raster, 5, x0=4, y0=6)
+    assert quadbin.cells_to_raster(cells, values, 5, 4, 6, 4, 3) == raster
+    assert quadbin.cells_to_raster(cells, values, 5, 5, 7, 2, 3, nodata=0) == [
+        [6, 7],
+        [10, 11],
+        [0, 0],
+    ]
+
+
+def test_cells_to_raster_coarser_cells():
+    parent = quadbin.tile_to_cell((2, 3, 4))
+    assert quadbin.cells_to_raster([parent], [7], 5, 3, 5, 3, 3) == [
+        [None, None, None],
+        [None, 7, 7],
+        [None, 7, 7],
+    ]
+
+
+@pytest.mark.parametrize(
+    "aggregator,expected",
+    [
+        ("sum", [[10, 5]]),
+        ("count", [[4, 2]]),
+        ("min", [[1, 1]]),
+        ("max", [[4, 4]]),
+        ("mean", [[2.5, 2.5]]),
+    ],
+)
+def test_cells_to_raster_finer_cells(aggregator, expected):
+    children = quadbin.cell_to_children(quadbin.tile_to_cell((2, 3, 4)), 5)
+    cells = children + [quadbin.tile_to_cell((3, 3, 4))] * 2
+    values = [1, 2, 3, 4, 1, 4]
+    raster = quadbin.cells_to_raster(cells, values, 4, 2, 3, 2, 1, aggregator)
+    assert raster == expected
+
+
+def test_cells_to_raster_invalid():
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        quadbin.cells_to_raster([], [], 27, 0, 0, 1, 1)
+    with pytest.raises(ValueError, match="Invalid raster"):
+        quadbin.cells_to_raster([], [], 2, 0, 0, 5, 1)
+    with pytest.raises(ValueError, match="Wrong aggregator"):
+        quadbin.cells_to_raster([], [], 2, 0, 0, 1, 1, aggregator="median")
+    with pytest.raises(ValueError, match="should have one value per cell"):
+        quadbin.cells_to_raster([quadbin.tile_to_cell((0, 0, 2))], [], 2, 0, 0, 1, 1)
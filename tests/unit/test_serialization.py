@@ -0,0 +1,64 @@
+import io
+
+import pytest
+import quadbin
+
+
+CELLS = quadbin.cell_to_children(5209574053332910079, 9)
+
+
+def test_dump_load_cells():
+    fp = io.BytesIO()
+    assert quadbin.dump_cells(reversed(CELLS), fp, block_size=100) == 1024
+    # Header and index, and one byte per delta
+    assert len(fp.getvalue()) < 24 + 11 * 16 + 1024
+
+    fp.seek(0)
+    assert quadbin.load_cells(fp) == quadbin.CellSet(CELLS)
+
+
+def test_dump_load_cells_mixed():
+    cells = quadbin.CellSet(CELLS[:10] + [5209574053332910079, 5192650370358181887])
+    fp = io.BytesIO()
+    quadbin.dump_cells(cells, fp, block_size=3)
+    fp.seek(0)
+    assert quadbin.load_cells(fp) == cells
+
+    fp = io.BytesIO()
+    quadbin.dump_cells([], fp)
+    fp.seek(0)
+    assert quadbin.load_cells(fp) == quadbin.CellSet()
+
+
+@pytest.mark.parametrize(
+    "cells", [CELLS, CELLS[:5] + [5209574053332910079, 5192650370358181887]]
+)
+def test_cell_set_reader(cells):
+    fp = io.BytesIO()
+    quadbin.dump_cells(cells, fp, block_size=7)
+    fp.seek(0)
+    reader = quadbin.CellSetReader(fp)
+
+    assert len(reader) == len(cells)
+    for cell in cells:
+        assert cell in reader
+    for cell in quadbin.cell_to_children(5209556461146865663, 9)[:20]:
+        assert cell not in reader
+    assert 5209574053332910078 not in reader
+    assert 0 not in reader
+
+
+def test_cell_set_reader_invalid():
+    with pytest.raises(ValueError, match="truncated header"):
+        quadbin.CellSetReader(io.BytesIO(b"QBCS"))
+    with pytest.raises(ValueError, match="unknown format"):
+        quadbin.CellSetReader(io.BytesIO(b"\0" * 24))
+
+    fp = io.BytesIO()
+    quadbin.dump_cells(CELLS, fp)
+    with pytest.raises(ValueError, match="truncated index"):
+        quadbin.CellSetReader(io.BytesIO(fp.getvalue()[:30]))
+    with pytest.raises(ValueError, match="truncated data"):
+        quadbin.load_cells(io.BytesIO(fp.getvalue()[:-10]))
+    with pytest.raises(ValueError, match="Invalid block size"):
+        quadbin.dump_cells(CELLS, fp, block_size=0)
@@ -1,5 +1,13 @@
 import pytest
-from quadbin.utils import point_to_tile, point_to_tile_fraction, tile_area
+from quadbin.utils import (
+    compute_latitude,
+    compute_row_area,
+    point_to_tile,
+    point_to_tile_fraction,
+    row_area,
+    tile_area,
+    tile_to_latitude,
+)
 
 
 def test_point_to_tile_fraction():
@@ -204,3 +212,18 @@ def test_point_to_tile():
 )
 def test_tile_area(tile, expected):
     assert tile_area(tile) == pytest.approx(expected, rel=1.5e-1)
+
+
+def test_tile_to_latitude():
+    tile = (9, 8, 4)
+    assert tile_to_latitude(tile, 0) == compute_latitude(8, 4)
+    assert tile_to_latitude(tile, 1) == compute_latitude(9, 4)
+    assert tile_to_latitude(tile, 0.5) == compute_latitude(8.5, 4)
+    assert tile_to_latitude(tile, 0.25) == compute_latitude(8.25, 4)
+
+
+@pytest.mark.parametrize("z", [0, 1, 4, 14, 26])
+def test_row_area(z):
+    for y in [0, (1 << z) >> 1, (1 << z) - 1]:
+        assert row_area(y, z) == compute_row_area(y, z)
+        assert row_area(y, z) == tile_area((0, y, z))